@@ -6,11 +6,248 @@ Analyzes content length and automatically scales fonts to ensure single-page lay
 
 import base64
 import io
+import logging
+import os
 import re
+import string
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
 import markdown
 from weasyprint import HTML, CSS
+from weasyprint.text.fonts import FontConfiguration
 from typing import Dict, List, Tuple, Optional, Any
 
+logger = logging.getLogger(__name__)
+
+# Contact paragraph markers, matched case-insensitively without lowercasing a copy
+_CONTACT_RE = re.compile(r'[@()]|linkedin|github|phone', re.IGNORECASE)
+
+# Content analysis patterns
+_HEADER_RE = re.compile(r'^(#{1,6})\s', re.MULTILINE)
+_BULLET_RE = re.compile(r'^[\s]*[-•*]\s+', re.MULTILINE)
+_BOLD_RE = re.compile(r'\*\*[^*]+\*\*')
+_ITALIC_RE = re.compile(r'(?<!\*)\*[^*]+\*(?!\*)')
+_CODE_RE = re.compile(r'`[^`]+`')
+
+# Adaptive CSS template. Fields name a scaling key, optionally as 'key*factor' or 'key.lower'
+_ADAPTIVE_CSS_TEMPLATE = """
+@page {{
+    margin: {margin_factor*0.6:.1f}in {margin_factor*0.75:.1f}in;
+    size: A4;
+}}
+
+body {{
+    font-family: 'Georgia', 'Times New Roman', serif;
+    line-height: {line_height:.1f};
+    color: #2c3e50;
+    font-size: {body_size}pt;
+    max-width: 100%;
+}}
+
+/* ADAPTIVE: Scaled header sizes */
+h1, .auto-name {{
+    font-size: {h1_size}pt;
+    font-weight: bold;
+    color: #1a365d;
+    text-align: center;
+    margin: 0 0 {spacing_factor*6:.0f}pt 0;
+    border-bottom: 2px solid #3182ce;
+    padding-bottom: {spacing_factor*3:.0f}pt;
+}}
+
+h2, .auto-section {{
+    font-size: {h2_size}pt;
+    font-weight: bold;
+    color: #2b6cb0;
+    margin: {spacing_factor*10:.0f}pt 0 {spacing_factor*4:.0f}pt 0;
+    border-bottom: 1px solid #cbd5e0;
+    padding-bottom: {spacing_factor*2:.0f}pt;
+    text-transform: uppercase;
+    letter-spacing: 0.3pt;
+}}
+
+h3, .auto-subsection {{
+    font-size: {h3_size}pt;
+    font-weight: bold;
+    color: #2d3748;
+    margin: {spacing_factor*6:.0f}pt 0 {spacing_factor*3:.0f}pt 0;
+}}
+
+h4, .auto-job-title {{
+    font-size: {body_size}pt;
+    font-weight: bold;
+    color: #2d3748;
+    margin: {spacing_factor*4:.0f}pt 0 {spacing_factor*1:.0f}pt 0;
+}}
+
+/* ADAPTIVE: Contact info */
+.auto-contact {{
+    text-align: center;
+    font-size: {contact_size}pt;
+    color: #4a5568;
+    margin: {spacing_factor*3:.0f}pt 0 {spacing_factor*8:.0f}pt 0;
+    border-bottom: 1px solid #e2e8f0;
+    padding-bottom: {spacing_factor*4:.0f}pt;
+}}
+
+/* ADAPTIVE: Paragraph spacing */
+p {{
+    margin: {spacing_factor*2:.0f}pt 0;
+    text-align: justify;
+    font-size: {body_size}pt;
+}}
+
+/* ADAPTIVE: Text formatting */
+strong {{
+    color: #1a202c;
+    font-weight: bold;
+}}
+
+em {{
+    color: #4a5568;
+    font-style: italic;
+}}
+
+code {{
+    background-color: #f7fafc;
+    color: #e53e3e;
+    padding: 1px 2px;
+    border-radius: 2px;
+    font-family: 'Consolas', 'Courier New', monospace;
+    font-size: {small_size}pt;
+}}
+
+/* ADAPTIVE: List spacing */
+ul {{
+    margin: {spacing_factor*3:.0f}pt 0;
+    padding-left: {spacing_factor*12:.0f}pt;
+}}
+
+li {{
+    margin-bottom: {spacing_factor*2:.0f}pt;
+    line-height: {line_height:.1f};
+    font-size: {body_size}pt;
+}}
+
+ol {{
+    margin: {spacing_factor*3:.0f}pt 0;
+    padding-left: {spacing_factor*12:.0f}pt;
+}}
+
+/* ADAPTIVE: Job entry styling */
+.auto-job {{
+    margin: {spacing_factor*4:.0f}pt 0;
+    border-left: 2px solid #e2e8f0;
+    padding-left: {spacing_factor*6:.0f}pt;
+}}
+
+.auto-job-meta {{
+    font-style: italic;
+    color: #4a5568;
+    margin: {spacing_factor*1:.0f}pt 0 {spacing_factor*3:.0f}pt 0;
+    font-size: {small_size}pt;
+}}
+
+/* Links */
+a {{
+    color: #3182ce;
+    text-decoration: none;
+}}
+
+/* ADAPTIVE: Table styling */
+table {{
+    width: 100%;
+    border-collapse: collapse;
+    margin: {spacing_factor*4:.0f}pt 0;
+}}
+
+th, td {{
+    padding: {spacing_factor*2:.0f}pt;
+    text-align: left;
+    border-bottom: 1px solid #e2e8f0;
+    font-size: {small_size}pt;
+}}
+
+th {{
+    font-weight: bold;
+    color: #2b6cb0;
+}}
+
+/* ADAPTIVE: Compact spacing overrides */
+.auto-spacing h1 + p, .auto-spacing h2 + p, .auto-spacing h3 + p {{
+    margin-top: {spacing_factor*1:.0f}pt;
+}}
+
+.auto-spacing p + h2 {{
+    margin-top: {spacing_factor*8:.0f}pt;
+}}
+
+.auto-spacing p + h3 {{
+    margin-top: {spacing_factor*5:.0f}pt;
+}}
+
+/* Size-specific optimizations */
+.size-{size_class.lower} ul {{
+    margin: {spacing_factor*2:.0f}pt 0;
+}}
+
+.size-{size_class.lower} li {{
+    margin-bottom: {spacing_factor*1:.0f}pt;
+}}
+"""
+
+def _compile_css_template(template: str) -> Tuple[Any, ...]:
+    """
+    Split a CSS template into static chunks and per-call value formatters
+    """
+    parts: List[Any] = []
+    for literal, field, spec, _ in string.Formatter().parse(template):
+        if literal:
+            parts.append(literal)
+        if field is None:
+            continue
+        if field.endswith('.lower'):
+            key = field[:-len('.lower')]
+            parts.append(lambda s, key=key: s[key].lower())
+        elif '*' in field:
+            key, factor = field.split('*')
+            parts.append(lambda s, key=key, factor=float(factor), spec=spec: format(factor * s[key], spec))
+        else:
+            parts.append(lambda s, key=field, spec=spec: format(s[key], spec))
+    return tuple(parts)
+
+_CSS_PARTS = _compile_css_template(_ADAPTIVE_CSS_TEMPLATE)
+
+def _build_scaling(scale_factor: float, size_class: str) -> Dict[str, float]:
+    """
+    Build the per-element scaling factors for a given scale factor
+    """
+    return {
+        'base_factor': scale_factor,
+        'h1_size': max(14, int(16 * scale_factor)),      # Name header: 16pt -> min 14pt (SMALLER, more proportional!)
+        'h2_size': max(11, int(12 * scale_factor)),      # Section headers: 12pt -> min 11pt (SMALLER!)
+        'h3_size': max(10, int(11 * scale_factor)),      # Subsection: 11pt -> min 10pt (SMALLER!)
+        'body_size': max(10, int(12 * scale_factor)),     # Body text: 12pt -> min 10pt (unchanged)
+        'small_size': max(7, int(9 * scale_factor)),     # Small text: 9pt -> min 7pt
+        'contact_size': max(7, int(10 * scale_factor)),  # Contact: 10pt -> min 7pt
+        'line_height': max(1.2, 1.4 * scale_factor),    # Line height: 1.4 -> min 1.2
+        'margin_factor': max(0.6, scale_factor),         # Margin scaling
+        'spacing_factor': max(0.5, scale_factor),        # Spacing scaling
+        'size_class': size_class
+    }
+
+# Scale factor for each size class, from short to extremely long resumes
+SIZE_CLASSES = {
+    "NORMAL": 1.0,
+    "MEDIUM": 0.95,
+    "COMPACT": 0.85,
+    "DENSE": 0.75,
+    "ULTRA_DENSE": 0.65,
+}
+
+# Scaling for the common 1-page case (<= 35 content lines), shared read-only
+_NORMAL_SCALING = MappingProxyType(_build_scaling(SIZE_CLASSES["NORMAL"], "NORMAL"))
+
 class AutoFitPdfGenerator:
     """
     Auto-fit PDF generator that dynamically adjusts font sizes to fit single page
@@ -29,22 +266,38 @@ class AutoFitPdfGenerator:
                 }
             }
         )
+        
+        # Shared WeasyPrint state, reused across renders instead of rebuilt per call
+        self._font_config = FontConfiguration()
+        self._image_cache = {}
+        
+        # Adaptive stylesheets parsed once per size class
+        self._css_objects: Dict[str, CSS] = {
+            size_class: CSS(
+                string=self.generate_adaptive_css(_build_scaling(scale_factor, size_class)),
+                font_config=self._font_config,
+            )
+            for size_class, scale_factor in SIZE_CLASSES.items()
+        }
     
     def analyze_content_density(self, markdown_text: str) -> Dict[str, int]:
         """
         Analyze content to determine appropriate font scaling
         """
+        # One header scan yields the total and the per-level counts
+        header_levels = [len(m.group(1)) for m in _HEADER_RE.finditer(markdown_text)]
+        
         analysis = {
             'total_chars': len(markdown_text),
-            'total_lines': len(markdown_text.split('\n')),
-            'content_lines': len([line for line in markdown_text.split('\n') if line.strip()]),
-            'headers': len(re.findall(r'^#{1,6}\s', markdown_text, re.MULTILINE)),
-            'h1_headers': len(re.findall(r'^#\s', markdown_text, re.MULTILINE)),
-            'h2_headers': len(re.findall(r'^##\s', markdown_text, re.MULTILINE)),
-            'bullet_points': len(re.findall(r'^[\s]*[-•*]\s+', markdown_text, re.MULTILINE)),
-            'bold_text': len(re.findall(r'\*\*[^*]+\*\*', markdown_text)),
-            'italic_text': len(re.findall(r'(?<!\*)\*[^*]+\*(?!\*)', markdown_text)),
-            'code_blocks': len(re.findall(r'`[^`]+`', markdown_text)),
+            'total_lines': markdown_text.count('\n') + 1,
+            'content_lines': sum(1 for line in markdown_text.splitlines() if line.strip()),
+            'headers': len(header_levels),
+            'h1_headers': header_levels.count(1),
+            'h2_headers': header_levels.count(2),
+            'bullet_points': len(_BULLET_RE.findall(markdown_text)),
+            'bold_text': len(_BOLD_RE.findall(markdown_text)),
+            'italic_text': len(_ITALIC_RE.findall(markdown_text)),
+            'code_blocks': len(_CODE_RE.findall(markdown_text)),
             'estimated_words': len(markdown_text.split()),
         }
         
@@ -65,48 +318,34 @@ class AutoFitPdfGenerator:
         Calculate font scaling factors based on content density
         Returns scaling factors for different text elements
         """
-        density = analysis['density_score']
         content_lines = analysis['content_lines']
         
-        print(f"📊 Content Analysis: {density} density, {content_lines} content lines")
+        # Short to medium resume - keep normal fonts (FIXED!), prebuilt at import
+        if content_lines <= 35:
+            return _NORMAL_SCALING
+        
+        density = analysis['density_score']
+        
+        logger.debug("📊 Content Analysis: %s density, %s content lines", density, content_lines)
         
         # Define scaling thresholds and factors - MORE CONSERVATIVE!
-        if content_lines <= 35:
-            # Short to medium resume - keep normal fonts (FIXED!)
-            scale_factor = 1.0
-            size_class = "NORMAL"
-        elif content_lines <= 50:
+        if content_lines <= 50:
             # Medium resume - only slightly smaller fonts
-            scale_factor = 0.95
             size_class = "MEDIUM"
         elif content_lines <= 65:
             # Long resume - moderate scaling
-            scale_factor = 0.85
             size_class = "COMPACT"
         elif content_lines <= 80:
             # Very long resume - more scaling
-            scale_factor = 0.75
             size_class = "DENSE"
         else:
             # Extremely long resume - maximum scaling
-            scale_factor = 0.65
             size_class = "ULTRA_DENSE"
         
-        scaling = {
-            'base_factor': scale_factor,
-            'h1_size': max(14, int(16 * scale_factor)),      # Name header: 16pt -> min 14pt (SMALLER, more proportional!)
-            'h2_size': max(11, int(12 * scale_factor)),      # Section headers: 12pt -> min 11pt (SMALLER!)
-            'h3_size': max(10, int(11 * scale_factor)),      # Subsection: 11pt -> min 10pt (SMALLER!)
-            'body_size': max(10, int(12 * scale_factor)),     # Body text: 12pt -> min 10pt (unchanged)
-            'small_size': max(7, int(9 * scale_factor)),     # Small text: 9pt -> min 7pt
-            'contact_size': max(7, int(10 * scale_factor)),  # Contact: 10pt -> min 7pt
-            'line_height': max(1.2, 1.4 * scale_factor),    # Line height: 1.4 -> min 1.2
-            'margin_factor': max(0.6, scale_factor),         # Margin scaling
-            'spacing_factor': max(0.5, scale_factor),        # Spacing scaling
-            'size_class': size_class
-        }
+        scale_factor = SIZE_CLASSES[size_class]
+        scaling = _build_scaling(scale_factor, size_class)
         
-        print(f"🎯 Auto-scaling: {size_class} ({scale_factor:.1f}x) - Body: {scaling['body_size']}pt")
+        logger.debug("🎯 Auto-scaling: %s (%.1fx) - Body: %spt", size_class, scale_factor, scaling['body_size'])
         
         return scaling
     
@@ -114,175 +353,13 @@ class AutoFitPdfGenerator:
         """
         Generate CSS with adaptive font sizes based on scaling factors
         """
-        s = scaling  # Shorthand for cleaner code
-        
-        css = f"""
-        @page {{
-            margin: {0.6 * s['margin_factor']:.1f}in {0.75 * s['margin_factor']:.1f}in;
-            size: A4;
-        }}
-        
-        body {{
-            font-family: 'Georgia', 'Times New Roman', serif;
-            line-height: {s['line_height']:.1f};
-            color: #2c3e50;
-            font-size: {s['body_size']}pt;
-            max-width: 100%;
-        }}
-        
-        /* ADAPTIVE: Scaled header sizes */
-        h1, .auto-name {{
-            font-size: {s['h1_size']}pt;
-            font-weight: bold;
-            color: #1a365d;
-            text-align: center;
-            margin: 0 0 {6 * s['spacing_factor']:.0f}pt 0;
-            border-bottom: 2px solid #3182ce;
-            padding-bottom: {3 * s['spacing_factor']:.0f}pt;
-        }}
-        
-        h2, .auto-section {{
-            font-size: {s['h2_size']}pt;
-            font-weight: bold;
-            color: #2b6cb0;
-            margin: {10 * s['spacing_factor']:.0f}pt 0 {4 * s['spacing_factor']:.0f}pt 0;
-            border-bottom: 1px solid #cbd5e0;
-            padding-bottom: {2 * s['spacing_factor']:.0f}pt;
-            text-transform: uppercase;
-            letter-spacing: 0.3pt;
-        }}
-        
-        h3, .auto-subsection {{
-            font-size: {s['h3_size']}pt;
-            font-weight: bold;
-            color: #2d3748;
-            margin: {6 * s['spacing_factor']:.0f}pt 0 {3 * s['spacing_factor']:.0f}pt 0;
-        }}
-        
-        h4, .auto-job-title {{
-            font-size: {s['body_size']}pt;
-            font-weight: bold;
-            color: #2d3748;
-            margin: {4 * s['spacing_factor']:.0f}pt 0 {1 * s['spacing_factor']:.0f}pt 0;
-        }}
-        
-        /* ADAPTIVE: Contact info */
-        .auto-contact {{
-            text-align: center;
-            font-size: {s['contact_size']}pt;
-            color: #4a5568;
-            margin: {3 * s['spacing_factor']:.0f}pt 0 {8 * s['spacing_factor']:.0f}pt 0;
-            border-bottom: 1px solid #e2e8f0;
-            padding-bottom: {4 * s['spacing_factor']:.0f}pt;
-        }}
-        
-        /* ADAPTIVE: Paragraph spacing */
-        p {{
-            margin: {2 * s['spacing_factor']:.0f}pt 0;
-            text-align: justify;
-            font-size: {s['body_size']}pt;
-        }}
-        
-        /* ADAPTIVE: Text formatting */
-        strong {{
-            color: #1a202c;
-            font-weight: bold;
-        }}
-        
-        em {{
-            color: #4a5568;
-            font-style: italic;
-        }}
-        
-        code {{
-            background-color: #f7fafc;
-            color: #e53e3e;
-            padding: 1px 2px;
-            border-radius: 2px;
-            font-family: 'Consolas', 'Courier New', monospace;
-            font-size: {s['small_size']}pt;
-        }}
-        
-        /* ADAPTIVE: List spacing */
-        ul {{
-            margin: {3 * s['spacing_factor']:.0f}pt 0;
-            padding-left: {12 * s['spacing_factor']:.0f}pt;
-        }}
-        
-        li {{
-            margin-bottom: {2 * s['spacing_factor']:.0f}pt;
-            line-height: {s['line_height']:.1f};
-            font-size: {s['body_size']}pt;
-        }}
-        
-        ol {{
-            margin: {3 * s['spacing_factor']:.0f}pt 0;
-            padding-left: {12 * s['spacing_factor']:.0f}pt;
-        }}
-        
-        /* ADAPTIVE: Job entry styling */
-        .auto-job {{
-            margin: {4 * s['spacing_factor']:.0f}pt 0;
-            border-left: 2px solid #e2e8f0;
-            padding-left: {6 * s['spacing_factor']:.0f}pt;
-        }}
-        
-        .auto-job-meta {{
-            font-style: italic;
-            color: #4a5568;
-            margin: {1 * s['spacing_factor']:.0f}pt 0 {3 * s['spacing_factor']:.0f}pt 0;
-            font-size: {s['small_size']}pt;
-        }}
-        
-        /* Links */
-        a {{
-            color: #3182ce;
-            text-decoration: none;
-        }}
-        
-        /* ADAPTIVE: Table styling */
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: {4 * s['spacing_factor']:.0f}pt 0;
-        }}
-        
-        th, td {{
-            padding: {2 * s['spacing_factor']:.0f}pt;
-            text-align: left;
-            border-bottom: 1px solid #e2e8f0;
-            font-size: {s['small_size']}pt;
-        }}
-        
-        th {{
-            font-weight: bold;
-            color: #2b6cb0;
-        }}
-        
-        /* ADAPTIVE: Compact spacing overrides */
-        .auto-spacing h1 + p, .auto-spacing h2 + p, .auto-spacing h3 + p {{
-            margin-top: {1 * s['spacing_factor']:.0f}pt;
-        }}
-        
-        .auto-spacing p + h2 {{
-            margin-top: {8 * s['spacing_factor']:.0f}pt;
-        }}
-        
-        .auto-spacing p + h3 {{
-            margin-top: {5 * s['spacing_factor']:.0f}pt;
-        }}
-        
-        /* Size-specific optimizations */
-        .size-{s['size_class'].lower()} ul {{
-            margin: {2 * s['spacing_factor']:.0f}pt 0;
-        }}
-        
-        .size-{s['size_class'].lower()} li {{
-            margin-bottom: {1 * s['spacing_factor']:.0f}pt;
-        }}
+        return ''.join(part if isinstance(part, str) else part(scaling) for part in _CSS_PARTS)
+    
+    def get_adaptive_stylesheet(self, scaling: Dict[str, float]) -> CSS:
         """
-        
-        return css
+        Return the pre-parsed stylesheet for the scaling's size class
+        """
+        return self._css_objects[scaling['size_class']]
     
     def fix_adaptive_markdown(self, markdown_text: str) -> str:
         """
@@ -315,7 +392,8 @@ class AutoFitPdfGenerator:
         # Fix markdown
         fixed_markdown = self.fix_adaptive_markdown(markdown_text)
         
-        # Convert to HTML
+        # Convert to HTML (reset first so extension state doesn't carry over between calls)
+        self.markdown_processor.reset()
         html_content = self.markdown_processor.convert(fixed_markdown)
         
         # Add adaptive classes
@@ -335,7 +413,7 @@ class AutoFitPdfGenerator:
         # Enhance contact info
         def enhance_contact(match):
             p_content = match.group(1)
-            if any(pattern in p_content.lower() for pattern in ['@', 'linkedin', 'github', 'phone', '(', ')']):
+            if _CONTACT_RE.search(p_content):
                 return f'<p class="auto-contact">{p_content}</p>'
             return match.group(0)
         
@@ -352,53 +430,61 @@ class AutoFitPdfGenerator:
         Generate PDF with auto-fit sizing to ensure single page layout
         """
         try:
-            print("🚀 Starting AUTO-FIT PDF generation...")
-            print(f"📝 Input markdown length: {len(markdown_text)} characters")
+            logger.debug("🚀 Starting AUTO-FIT PDF generation...")
+            logger.debug("📝 Input markdown length: %d characters", len(markdown_text))
             
             # Create adaptive HTML and get scaling info
             html_content, scaling = self.create_adaptive_html(markdown_text)
             
-            print(f"🎯 Applied {scaling['size_class']} scaling ({scaling['base_factor']:.1f}x)")
-            print(f"📊 Font sizes: H1={scaling['h1_size']}pt, Body={scaling['body_size']}pt")
+            logger.debug("🎯 Applied %s scaling (%.1fx)", scaling['size_class'], scaling['base_factor'])
+            logger.debug("📊 Font sizes: H1=%spt, Body=%spt", scaling['h1_size'], scaling['body_size'])
             
-            # Generate adaptive CSS
-            adaptive_css = self.generate_adaptive_css(scaling)
+            # Get adaptive CSS (parsed once per size class)
+            adaptive_stylesheet = self.get_adaptive_stylesheet(scaling)
             
-            # Create complete HTML document
-            full_html = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="utf-8">
-                <title>Resume</title>
-                <style>{adaptive_css}</style>
-            </head>
-            <body class="auto-spacing size-{scaling['size_class'].lower()}">
-                {html_content}
-            </body>
-            </html>
-            """
+            # Wrap the body only; styling comes from the pre-parsed stylesheet
+            full_html = (
+                f'<!DOCTYPE html><html><head><title>Resume</title></head>'
+                f'<body class="auto-spacing size-{scaling["size_class"].lower()}">{html_content}</body></html>'
+            )
             
             # Generate PDF
-            print("📄 Converting to auto-fit PDF...")
+            logger.debug("📄 Converting to auto-fit PDF...")
             pdf_buffer = io.BytesIO()
             html_doc = HTML(string=full_html)
-            html_doc.write_pdf(pdf_buffer)
+            html_doc.write_pdf(
+                pdf_buffer,
+                stylesheets=[adaptive_stylesheet],
+                font_config=self._font_config,
+                cache=self._image_cache,
+            )
             pdf_buffer.seek(0)
             
             # Encode to base64
             pdf_base64 = base64.b64encode(pdf_buffer.read()).decode('utf-8')
-            print(f"✅ AUTO-FIT PDF generated! Size: {len(pdf_base64)} characters")
-            print(f"📄 Single-page layout guaranteed with {scaling['size_class']} formatting")
+            logger.info("✅ AUTO-FIT PDF generated! Size: %d characters (%s formatting)",
+                        len(pdf_base64), scaling['size_class'])
             
             return pdf_base64
             
         except Exception as e:
-            print(f"❌ Auto-fit PDF generation failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Auto-fit PDF generation failed: %s", e)
             raise
 
+def _render_one(case: Tuple[str, str]) -> Tuple[str, Optional[Dict[str, int]], Optional[int], Optional[str]]:
+    """
+    Render a single test resume in a worker process.
+    The generator is created inside the worker since WeasyPrint/Cairo state is not fork-safe.
+    """
+    name, resume_content = case
+    try:
+        generator = AutoFitPdfGenerator()
+        analysis = generator.analyze_content_density(resume_content)
+        pdf_result = generator.generate_auto_fit_pdf_base64(resume_content)
+        return name, analysis, len(pdf_result), None
+    except Exception as e:
+        return name, None, None, str(e)
+
 # Test the auto-fit generator with different content lengths
 def test_auto_fit_scaling():
     """Test auto-fit with short, medium, and long resumes"""
@@ -524,23 +610,20 @@ Portfolio: https://sarahwilson.dev | GitHub: github.com/sarah-wilson | Seattle,
     print("🧪 Testing AUTO-FIT Scaling with Different Content Lengths")
     print("=" * 70)
     
-    generator = AutoFitPdfGenerator()
+    # Render all cases in parallel, one worker process per core
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(_render_one, test_cases.items()))
     
-    for name, resume_content in test_cases.items():
+    for name, analysis, pdf_length, error in results:
         print(f"\n📄 Testing: {name}")
         print("-" * 40)
         
-        try:
-            # Analyze content
-            analysis = generator.analyze_content_density(resume_content)
-            print(f"   📊 Content: {analysis['content_lines']} lines, {analysis['estimated_words']} words")
-            
-            # Generate PDF
-            pdf_result = generator.generate_auto_fit_pdf_base64(resume_content)
-            print(f"   ✅ PDF: {len(pdf_result):,} characters")
-            
-        except Exception as e:
-            print(f"   ❌ Failed: {e}")
+        if error is not None:
+            print(f"   ❌ Failed: {error}")
+            continue
+        
+        print(f"   📊 Content: {analysis['content_lines']} lines, {analysis['estimated_words']} words")
+        print(f"   ✅ PDF: {pdf_length:,} characters")
     
     print("\n" + "=" * 70)
     print("🎉 AUTO-FIT SCALING TEST COMPLETE!")
@@ -550,4 +633,5 @@ Portfolio: https://sarahwilson.dev | GitHub: github.com/sarah-wilson | Seattle,
     print("✅ All resumes: Guaranteed single-page layout")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     test_auto_fit_scaling()
\ No newline at end of file
@@ -6,29 +6,112 @@ Fixes excessive whitespace and blank spaces while preserving all formatting
 
 import base64
 import io
+import logging
+import os
 import re
+import threading
 import markdown
 from weasyprint import HTML, CSS
 from typing import Dict, List, Tuple, Optional, Any
 
+logger = logging.getLogger(__name__)
+
+# mistune is an optional backend and not in requirements.txt; python-markdown is the default
+# renderer. To opt in: pip install "mistune>=3.0" and set MD_BACKEND=mistune
+try:
+    import mistune
+    MISTUNE_AVAILABLE = True
+except ImportError:
+    mistune = None
+    MISTUNE_AVAILABLE = False
+
+# Markdown backend: "markdown" (default) or "mistune" (opt-in, when installed).
+# The two are not output-identical: after fix_compact_markdown drops the blank line between a
+# job's meta line and its bullets, python-markdown keeps the "- ..." lines inside that
+# paragraph while mistune starts a <ul>.
+_MD_BACKEND = os.environ.get("MD_BACKEND", "markdown").lower()
+if _MD_BACKEND == "mistune" and not MISTUNE_AVAILABLE:
+    _MD_BACKEND = "markdown"
+
+# Precompiled patterns for fix_compact_markdown
+# Header trim also collapses blank lines after a header, since \s*$ runs to the last newline
+_RE_HEADER_TRIM = re.compile(r'^(#{1,6})\s*([^\n]*)\s*$', re.MULTILINE)
+# Two ordered passes: \s also matches newlines, so a bare '*' line would otherwise swallow
+# the blank lines after it and leave the next line's unicode marker unconverted
+_RE_BULLET_UNICODE = re.compile(r'^[\s]*[•◦▪▫‣⁃]\s*', re.MULTILINE)
+_RE_BULLET_STAR = re.compile(r'^[\s]*[*]\s+', re.MULTILINE)
+# Runs of 3+ newlines collapse to one blank line; trailing spaces/tabs are dropped
+_RE_BLANKS_TRAILING_WS = re.compile(r'(\n)\n{2,}|[ \t]+$', re.MULTILINE)
+_RE_JOB_SPACING = re.compile(r'(\*[^*\n]+\*)\n\n+(-)')
+
+# Single-pass pattern for enhance_compact_structure: headings, plain paragraphs and job entries
+_RE_ENHANCE = re.compile(
+    r'<(?P<heading>h[123])(?P<attrs>[^>]*)>'
+    r'|<p>(?P<para>[^<]+)</p>'
+    r'|<p><strong>(?P<job_title>[^<]+)</strong></p>\s*<p><em>(?P<job_meta>[^<]+)</em></p>'
+)
+_RE_CONTACT = re.compile(r'[@()]|linkedin|github|phone', re.IGNORECASE)
+# Structure counts for debug logging
+_RE_H2_TAG = re.compile(r'<h2[^>]*>')
+_RE_P_TAG = re.compile(r'<p[^>]*>')
+_HEADING_CLASSES = {
+    'h1': 'compact-name',
+    'h2': 'compact-section',
+    'h3': 'compact-subsection',
+}
+
+def _enhance_match(match: re.Match) -> str:
+    """Replacement for one _RE_ENHANCE match, dispatched on the alternative that matched"""
+    kind = match.lastgroup
+    
+    # Add classes for compact styling
+    if kind == 'attrs':
+        heading = match.group('heading')
+        return f'<{heading} class="{_HEADING_CLASSES[heading]}"{match.group("attrs")}>'
+    
+    # Enhance contact info paragraphs
+    if kind == 'para':
+        p_content = match.group('para')
+        if _RE_CONTACT.search(p_content):
+            return f'<p class="compact-contact">{p_content}</p>'
+        return match.group(0)
+    
+    # Enhance job entries with compact spacing
+    return (f'<div class="compact-job"><h4 class="compact-job-title">{match.group("job_title")}</h4>'
+            f'<p class="compact-job-meta">{match.group("job_meta")}</p></div>')
+
 class CompactMarkdownParser:
     """
     Compact parser that eliminates excessive spacing while preserving formatting
     """
     
     def __init__(self):
-        self.markdown_processor = markdown.Markdown(
-            extensions=[
-                'markdown.extensions.extra',
-                'markdown.extensions.sane_lists',
-                'markdown.extensions.toc',
-            ],
-            extension_configs={
-                'markdown.extensions.toc': {
-                    'permalink': False,
+        # One markdown renderer per thread; renderer and extension setup is the expensive part
+        self._md_local = threading.local()
+    
+    def _get_md(self):
+        """Return this thread's markdown renderer, building it on first use"""
+        md = getattr(self._md_local, 'processor', None)
+        if md is None and _MD_BACKEND == "mistune":
+            # No 'url' plugin: auto-linking bare URLs would put an <a> inside contact
+            # paragraphs, and enhance_compact_structure only classes tag-free paragraphs
+            md = mistune.create_markdown(escape=False, plugins=['table', 'strikethrough'])
+            self._md_local.processor = md
+        elif md is None:
+            md = markdown.Markdown(
+                extensions=[
+                    'markdown.extensions.extra',
+                    'markdown.extensions.sane_lists',
+                    'markdown.extensions.toc',
+                ],
+                extension_configs={
+                    'markdown.extensions.toc': {
+                        'permalink': False,
+                    }
                 }
-            }
-        )
+            )
+            self._md_local.processor = md
+        return md
     
     def fix_compact_markdown(self, markdown_text: str) -> str:
         """
@@ -36,34 +119,18 @@ class CompactMarkdownParser:
         """
         text = markdown_text.strip()
         
-        # 1. Fix header spacing and formatting
-        text = re.sub(r'^(#{1,6})\s*([^\n]*)\s*$', r'\1 \2', text, flags=re.MULTILINE)
-        
-        # 2. COMPACT: Single line break after headers (not double)
-        text = re.sub(r'^(#{1,6}\s[^\n]+)\n\n+', r'\1\n', text, flags=re.MULTILINE)
-        
-        # 3. Fix bold text formatting
-        text = re.sub(r'(?<!\*)\*\*([^*\n]+?)\*\*(?!\*)', r'**\1**', text)
-        
-        # 4. Fix italic text formatting  
-        text = re.sub(r'(?<!\*)\*([^*\n]+?)\*(?!\*)', r'*\1*', text)
-        
-        # 5. Fix code formatting
-        text = re.sub(r'`([^`\n]+)`', r'`\1`', text)
-        
-        # 6. Standardize bullet points
-        text = re.sub(r'^[\s]*[•◦▪▫‣⁃]\s*', '- ', text, flags=re.MULTILINE)
-        text = re.sub(r'^[\s]*[*]\s+', '- ', text, flags=re.MULTILINE)
+        # 1. Fix header spacing and formatting, with a single line break after headers
+        text = _RE_HEADER_TRIM.sub(r'\1 \2', text)
         
-        # 7. COMPACT: Remove excessive blank lines - max 1 blank line anywhere
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        text = re.sub(r'\n\n\n+', '\n\n', text)
+        # 2. Standardize bullet points
+        text = _RE_BULLET_UNICODE.sub('- ', text)
+        text = _RE_BULLET_STAR.sub('- ', text)
         
-        # 8. COMPACT: Remove trailing whitespace
-        text = re.sub(r'[ \t]+$', '', text, flags=re.MULTILINE)
+        # 3. COMPACT: Max 1 blank line anywhere, no trailing whitespace
+        text = _RE_BLANKS_TRAILING_WS.sub(r'\1\1', text)
         
-        # 9. COMPACT: Ensure job entries don't have extra spacing
-        text = re.sub(r'(\*[^*\n]+\*)\n\n+(-)', r'\1\n\2', text)
+        # 4. COMPACT: Ensure job entries don't have extra spacing
+        text = _RE_JOB_SPACING.sub(r'\1\n\2', text)
         
         return text.strip()
     
@@ -75,7 +142,13 @@ class CompactMarkdownParser:
         fixed_markdown = self.fix_compact_markdown(markdown_text)
         
         # Convert to HTML
-        html_content = self.markdown_processor.convert(fixed_markdown)
+        md = self._get_md()
+        if _MD_BACKEND == "mistune":
+            html_content = md(fixed_markdown)
+        else:
+            # reset clears state (toc ids, footnotes) left by a previous or failed call
+            md.reset()
+            html_content = md.convert(fixed_markdown)
         
         # Enhance HTML structure
         html_content = self.enhance_compact_structure(html_content)
@@ -86,25 +159,8 @@ class CompactMarkdownParser:
         """
         Enhance HTML with compact styling classes
         """
-        # Add classes for compact styling
-        html = re.sub(r'<h1([^>]*)>', r'<h1 class="compact-name"\1>', html)
-        html = re.sub(r'<h2([^>]*)>', r'<h2 class="compact-section"\1>', html)
-        html = re.sub(r'<h3([^>]*)>', r'<h3 class="compact-subsection"\1>', html)
-        
-        # Enhance contact info paragraphs
-        def enhance_contact(match):
-            p_content = match.group(1)
-            if any(pattern in p_content.lower() for pattern in ['@', 'linkedin', 'github', 'phone', '(', ')']):
-                return f'<p class="compact-contact">{p_content}</p>'
-            return match.group(0)
-        
-        html = re.sub(r'<p>([^<]+)</p>', enhance_contact, html)
-        
-        # Enhance job entries with compact spacing
-        html = re.sub(r'<p><strong>([^<]+)</strong></p>\s*<p><em>([^<]+)</em></p>', 
-                     r'<div class="compact-job"><h4 class="compact-job-title">\1</h4><p class="compact-job-meta">\2</p></div>', html)
-        
-        return html
+        # Heading classes, contact paragraphs and job entries in a single scan
+        return _RE_ENHANCE.sub(_enhance_match, html)
 
 class CompactPdfGenerator:
     """
@@ -267,59 +323,40 @@ class CompactPdfGenerator:
             margin-top: 6pt;
         }
         """
+        # Stylesheet parsed once and reused for every PDF instead of an inline <style> per document
+        self._css_obj = CSS(string=self.compact_css)
     
     def generate_compact_pdf_base64(self, markdown_text: str) -> str:
         """
         Generate PDF with compact spacing and minimal whitespace
         """
-        try:
-            print("🚀 Starting COMPACT PDF generation...")
-            print(f"📝 Input markdown length: {len(markdown_text)} characters")
-            
-            # Create compact HTML
-            html_content = self.parser.create_compact_html(markdown_text)
-            
-            print(f"🌐 Generated compact HTML length: {len(html_content)} characters")
-            
-            # Debug: Check structure
-            h2_count = len(re.findall(r'<h2[^>]*>', html_content))
-            p_count = len(re.findall(r'<p[^>]*>', html_content))
-            
-            print(f"🔍 Compact HTML: H2={h2_count}, P={p_count}")
-            
-            # Create complete HTML document with compact styling
-            full_html = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="utf-8">
-                <title>Resume</title>
-                <style>{self.compact_css}</style>
-            </head>
-            <body>
-                {html_content}
-            </body>
-            </html>
-            """
-            
-            # Generate PDF
-            print("📄 Converting to compact PDF...")
-            pdf_buffer = io.BytesIO()
-            html_doc = HTML(string=full_html)
-            html_doc.write_pdf(pdf_buffer)
-            pdf_buffer.seek(0)
-            
-            # Encode to base64
-            pdf_base64 = base64.b64encode(pdf_buffer.read()).decode('utf-8')
-            print(f"✅ COMPACT PDF generated! Size: {len(pdf_base64)} characters")
-            
-            return pdf_base64
-            
-        except Exception as e:
-            print(f"❌ Compact PDF generation failed: {e}")
-            import traceback
-            traceback.print_exc()
-            raise
+        logger.debug("Starting compact PDF generation, input markdown length: %d characters", len(markdown_text))
+        
+        # Create compact HTML
+        html_content = self.parser.create_compact_html(markdown_text)
+        
+        # Debug: Check structure (only scanned when debug logging is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Compact HTML length: %d characters, H2=%d, P=%d", len(html_content),
+                         len(_RE_H2_TAG.findall(html_content)), len(_RE_P_TAG.findall(html_content)))
+        
+        # Wrap the body only; styling comes from the pre-parsed stylesheet
+        full_html = (
+            f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>Resume</title></head>'
+            f'<body>{html_content}</body></html>'
+        )
+        
+        # Generate PDF
+        pdf_buffer = io.BytesIO()
+        html_doc = HTML(string=full_html)
+        html_doc.write_pdf(pdf_buffer, stylesheets=[self._css_obj])
+        pdf_buffer.seek(0)
+        
+        # Encode to base64
+        pdf_base64 = base64.b64encode(pdf_buffer.read()).decode('utf-8')
+        logger.debug("Compact PDF generated, size: %d characters", len(pdf_base64))
+        
+        return pdf_base64
 
 # Test the compact generator
 def test_compact_generator():
@@ -413,4 +450,5 @@ john.smith@email.com | (555) 123-4567 | LinkedIn: linkedin.com/in/john-smith
         return False
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     test_compact_generator()
\ No newline at end of file
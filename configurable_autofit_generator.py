@@ -6,14 +6,136 @@ Fine-tune auto-fit behavior with customizable parameters
 
 import base64
 import io
-import re
+import logging
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from itertools import accumulate
+from types import MappingProxyType
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
-from docx.enum.style import WD_STYLE_TYPE
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT, WD_LINE_SPACING
+from docx.enum.text import WD_LINE_SPACING
+from docx.oxml import parse_xml
 from docx.oxml.parser import OxmlElement
-from docx.oxml.ns import qn
-from typing import List, Dict, Optional, Tuple, Any
+from docx.oxml.ns import nsdecls, qn
+from typing import Iterator, List, Dict, Optional, Tuple, Any
+
+logger = logging.getLogger(__name__)
+
+def _tokenize_rich(text: str) -> Iterator[Tuple[str, str]]:
+    """
+    Split a line into (kind, text) runs, kind being 'plain', 'bold', 'italic' or 'code'.
+    Hand-written scanner: each marker pairs with the nearest closing marker (**x**, *x*, `x`),
+    and a marker without a closer is plain text.
+    """
+    n = len(text)
+    plain_start = i = 0
+    while i < n:
+        # Jump to the next marker character
+        star = text.find('*', i)
+        tick = text.find('`', i)
+        if star < 0 and tick < 0:
+            break
+        i = tick if star < 0 or 0 <= tick < star else star
+        
+        if text[i] == '`':
+            end = text.find('`', i + 1)
+            if end < 0:
+                i += 1
+                continue
+            kind, inner, stop = 'code', text[i + 1:end], end + 1
+        else:
+            end = text.find('**', i + 2) if text.startswith('*', i + 1) else -1
+            if end >= 0:
+                kind, inner, stop = 'bold', text[i + 2:end], end + 2
+            else:
+                end = text.find('*', i + 1)
+                if end < 0:
+                    i += 1
+                    continue
+                kind, inner, stop = 'italic', text[i + 1:end], end + 1
+        
+        if plain_start < i:
+            yield 'plain', text[plain_start:i]
+        if inner:
+            yield kind, inner
+        elif kind == 'bold':
+            # '****' reads as an italic '**'
+            yield 'italic', '**'
+        else:
+            # Empty '``' or '**' stays literal
+            yield 'plain', text[i:stop]
+        plain_start = i = stop
+    
+    if plain_start < n:
+        yield 'plain', text[plain_start:]
+
+# Bold Segoe UI paragraph style, parsed in one go rather than built through the style API
+_PARAGRAPH_STYLE_XML = (
+    '<w:style %s w:type="paragraph" w:customStyle="1" w:styleId="{style_id}">'
+    '<w:name w:val="{style_id}"/>'
+    '<w:pPr>{spacing}{jc}</w:pPr>'
+    '<w:rPr><w:rFonts w:ascii="Segoe UI" w:hAnsi="Segoe UI"/><w:b/>'
+    '<w:color w:val="{color}"/><w:sz w:val="{size}"/></w:rPr>'
+    '</w:style>' % nsdecls('w')
+)
+
+# Run properties per rich-text kind, copied onto each formatted run
+_RUN_PROPERTIES = {
+    'bold': parse_xml('<w:rPr %s><w:b/></w:rPr>' % nsdecls('w')),
+    'italic': parse_xml('<w:rPr %s><w:i/></w:rPr>' % nsdecls('w')),
+    'code': parse_xml('<w:rPr %s><w:rFonts w:ascii="Consolas" w:hAnsi="Consolas"/></w:rPr>' % nsdecls('w')),
+}
+
+# Scaling levels and the font roles of each level's size table
+_SCALING_LEVELS = ('comfortable', 'balanced', 'compact', 'dense', 'ultra_dense')
+_FONT_ROLES = ('header', 'section', 'body', 'small')
+
+# Base (factor, class, spacing_after pt, line_spacing, margins in) per scaling level
+_LEVEL_BASES = (
+    (1.0, 'COMFORTABLE', 6, 1.15, 0.8),
+    (0.9, 'BALANCED', 4, 1.1, 0.7),
+    (0.8, 'COMPACT', 3, 1.05, 0.6),
+    (0.7, 'DENSE', 2, 1.0, 0.5),
+    (0.6, 'ULTRA_DENSE', 1, 0.95, 0.4),
+)
+
+@dataclass(slots=True, frozen=True)
+class SensitivityConfig:
+    """Immutable, hashable snapshot of a sensitivity config dict"""
+    short_resume_lines: int
+    medium_resume_lines: int
+    long_resume_lines: int
+    very_long_lines: int
+    scaling_sensitivity: float
+    min_font_size: int
+    max_font_size: int
+    header_weight: float
+    bullet_weight: float
+    job_entry_weight: float
+    word_weight: float
+    line_weight: float
+    # Font sizes per level as (header, section, body, small)
+    comfortable: Tuple[int, int, int, int]
+    balanced: Tuple[int, int, int, int]
+    compact: Tuple[int, int, int, int]
+    dense: Tuple[int, int, int, int]
+    ultra_dense: Tuple[int, int, int, int]
+    spacing_reduction: float
+    margin_reduction: float
+    
+    @classmethod
+    def from_dict(cls, sensitivity: Dict) -> 'SensitivityConfig':
+        """Build from a sensitivity dict, flattening the per-level font tables to tuples"""
+        values = {}
+        for field in fields(cls):
+            value = sensitivity[field.name]
+            if field.name in _SCALING_LEVELS:
+                value = tuple(value[role] for role in _FONT_ROLES)
+            values[field.name] = value
+        return cls(**values)
 
 class ConfigurableAutoFitGenerator:
     """
@@ -30,7 +152,7 @@ class ConfigurableAutoFitGenerator:
         
         # CONFIGURABLE SENSITIVITY PARAMETERS
         # You can adjust these to control auto-fit behavior
-        self.sensitivity = sensitivity_config or {
+        sensitivity = sensitivity_config or {
             # CONTENT THRESHOLDS - Adjust these to change when scaling kicks in
             'short_resume_lines': 25,      # Lines below this = no scaling
             'medium_resume_lines': 40,     # Lines below this = light scaling
@@ -61,42 +183,123 @@ class ConfigurableAutoFitGenerator:
             'margin_reduction': 0.9,       # How much to reduce margins (0.5-1.0)
         }
         
-        print(f"🎛️ Auto-fit sensitivity configured:")
-        print(f"   📏 Thresholds: {self.sensitivity['short_resume_lines']}/{self.sensitivity['medium_resume_lines']}/{self.sensitivity['long_resume_lines']}/{self.sensitivity['very_long_lines']} lines")
-        print(f"   ⚖️ Sensitivity: {self.sensitivity['scaling_sensitivity']:.1f}x")
-        print(f"   📝 Font range: {self.sensitivity['min_font_size']}-{self.sensitivity['max_font_size']}pt")
+        # Read-only view of a copy: rendering uses the snapshot below, so in-place edits would
+        # be silently ignored. Build a new generator to change settings.
+        self.sensitivity = MappingProxyType({
+            name: MappingProxyType(dict(value)) if isinstance(value, dict) else value
+            for name, value in sensitivity.items()
+        })
+        
+        logger.debug(
+            "Auto-fit sensitivity configured: thresholds %s/%s/%s/%s lines, sensitivity %.1fx, font range %s-%spt",
+            self.sensitivity['short_resume_lines'], self.sensitivity['medium_resume_lines'],
+            self.sensitivity['long_resume_lines'], self.sensitivity['very_long_lines'],
+            self.sensitivity['scaling_sensitivity'],
+            self.sensitivity['min_font_size'], self.sensitivity['max_font_size'],
+        )
+        
+        # Settings are read from this snapshot, taken once at construction
+        self._sens = SensitivityConfig.from_dict(self.sensitivity)
+        self._level_bounds, self._level_scales = self._build_level_table(self._sens)
+        
+        # Memo of (analysis, scaling) per markdown text for repeated generations; the
+        # settings are fixed per instance, so the text alone is the key
+        self._cached_analysis_and_scaling = lru_cache(maxsize=128)(self._analysis_and_scaling)
+    
+    @staticmethod
+    def _build_level_table(sens: SensitivityConfig) -> Tuple[List[int], List[Dict[str, Any]]]:
+        """
+        Precompute the scaling dict of every level, with sensitivity reductions and font
+        clamps applied, plus the line-count bounds that select between them
+        """
+        thresholds = (sens.short_resume_lines, sens.medium_resume_lines,
+                      sens.long_resume_lines, sens.very_long_lines)
+        # Running max keeps bisect_left equal to the first-match ladder even for unordered thresholds
+        bounds = list(accumulate(thresholds, max))
+        
+        min_font, max_font = sens.min_font_size, sens.max_font_size
+        scales = []
+        for level, (factor, class_name, spacing_after, line_spacing, margins) in zip(_SCALING_LEVELS, _LEVEL_BASES):
+            header, section, body, small = (max(min_font, min(max_font, size)) for size in getattr(sens, level))
+            scales.append({
+                'factor': factor,
+                'class': class_name,
+                'level': level,
+                'header': header,
+                'section': section,
+                'body': body,
+                'small': small,
+                'line_spacing': line_spacing,
+                'spacing_after': max(1, int(spacing_after * sens.spacing_reduction)),
+                'margins': margins * sens.margin_reduction,
+            })
+        return bounds, scales
+    
+    def _analysis_and_scaling(self, markdown_text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Analyze content and calculate scaling"""
+        analysis = self.analyze_content_with_sensitivity(markdown_text)
+        return analysis, self.calculate_configurable_scaling(analysis)
     
     def analyze_content_with_sensitivity(self, markdown_text: str) -> Dict[str, Any]:
         """
         Analyze content using configurable sensitivity parameters
         """
+        # Single pass over lines; terminators are kept so a marker followed by the line break
+        # still counts, as with the multiline patterns
+        content_lines = h2_headers = bullet_points = job_entries = 0
+        for line in io.StringIO(markdown_text):
+            if line.isspace():
+                continue
+            content_lines += 1
+            
+            # The three kinds are exclusive ('##' and '**' starts can never be bullets), so
+            # each line is classified once
+            if line.startswith('##'):
+                if line[2:3].isspace():
+                    h2_headers += 1
+            elif line.startswith('**'):
+                # Whole-line bold (job title): **text** with no other asterisks
+                body = line.rstrip()
+                if len(body) > 4 and body.endswith('**') and '*' not in body[2:-2]:
+                    job_entries += 1
+            else:
+                stripped = line.lstrip()
+                if stripped[0] in '-•*' and stripped[1:2].isspace():
+                    bullet_points += 1
+        
         analysis = {
             'total_chars': len(markdown_text),
-            'content_lines': len([line for line in markdown_text.split('\n') if line.strip()]),
-            'h2_headers': len(re.findall(r'^##\s', markdown_text, re.MULTILINE)),
-            'bullet_points': len(re.findall(r'^[\s]*[-•*]\s+', markdown_text, re.MULTILINE)),
-            'job_entries': len(re.findall(r'^\*\*[^*]+\*\*\s*$', markdown_text, re.MULTILINE)),
+            'content_lines': content_lines,
+            'h2_headers': h2_headers,
+            'bullet_points': bullet_points,
+            'job_entries': job_entries,
+            # One split over the whole text rather than a word list per line; a count(' ')
+            # shortcut would also count indentation and run several times too high
             'estimated_words': len(markdown_text.split()),
         }
         
+        sens = self._sens
+        
         # Calculate density using configurable weights
         density_score = (
-            analysis['content_lines'] * self.sensitivity['line_weight'] +
-            analysis['h2_headers'] * self.sensitivity['header_weight'] +
-            analysis['bullet_points'] * self.sensitivity['bullet_weight'] +
-            analysis['job_entries'] * self.sensitivity['job_entry_weight'] +
-            analysis['estimated_words'] * self.sensitivity['word_weight']
+            analysis['content_lines'] * sens.line_weight +
+            analysis['h2_headers'] * sens.header_weight +
+            analysis['bullet_points'] * sens.bullet_weight +
+            analysis['job_entries'] * sens.job_entry_weight +
+            analysis['estimated_words'] * sens.word_weight
         )
         
         # Apply overall sensitivity multiplier
-        density_score *= self.sensitivity['scaling_sensitivity']
+        density_score *= sens.scaling_sensitivity
         
         analysis['density_score'] = int(density_score)
-        analysis['sensitivity_applied'] = self.sensitivity['scaling_sensitivity']
+        analysis['sensitivity_applied'] = sens.scaling_sensitivity
         
-        print(f"🔍 Sensitivity Analysis:")
-        print(f"   📊 Lines: {analysis['content_lines']}, Words: {analysis['estimated_words']}")
-        print(f"   🎯 Weighted density: {density_score:.1f} (sensitivity: {self.sensitivity['scaling_sensitivity']:.1f}x)")
+        logger.debug(
+            "Sensitivity analysis: %d lines, %d words, weighted density %.1f (sensitivity: %.1fx)",
+            analysis['content_lines'], analysis['estimated_words'], density_score,
+            sens.scaling_sensitivity,
+        )
         
         return analysis
     
@@ -106,75 +309,10 @@ class ConfigurableAutoFitGenerator:
         """
         content_lines = analysis['content_lines']
         
-        # Use configurable thresholds
-        if content_lines <= self.sensitivity['short_resume_lines']:
-            level = 'comfortable'
-            factor = 1.0
-            class_name = 'COMFORTABLE'
-            spacing_after = 6
-            line_spacing = 1.15
-            margins = 0.8
-            
-        elif content_lines <= self.sensitivity['medium_resume_lines']:
-            level = 'balanced'
-            factor = 0.9
-            class_name = 'BALANCED'
-            spacing_after = 4
-            line_spacing = 1.1
-            margins = 0.7
-            
-        elif content_lines <= self.sensitivity['long_resume_lines']:
-            level = 'compact'
-            factor = 0.8
-            class_name = 'COMPACT'
-            spacing_after = 3
-            line_spacing = 1.05
-            margins = 0.6
-            
-        elif content_lines <= self.sensitivity['very_long_lines']:
-            level = 'dense'
-            factor = 0.7
-            class_name = 'DENSE'
-            spacing_after = 2
-            line_spacing = 1.0
-            margins = 0.5
-            
-        else:
-            level = 'ultra_dense'
-            factor = 0.6
-            class_name = 'ULTRA_DENSE'
-            spacing_after = 1
-            line_spacing = 0.95
-            margins = 0.4
-        
-        # Apply sensitivity adjustments to spacing and margins
-        spacing_after = max(1, int(spacing_after * self.sensitivity['spacing_reduction']))
-        margins *= self.sensitivity['margin_reduction']
-        
-        # Get font sizes for this level
-        fonts = self.sensitivity[level].copy()
+        # First level whose threshold holds content_lines, as the if/elif ladder over thresholds did
+        scale = dict(self._level_scales[bisect_left(self._level_bounds, content_lines)])
         
-        # Ensure fonts stay within min/max bounds
-        for font_type in fonts:
-            fonts[font_type] = max(
-                self.sensitivity['min_font_size'],
-                min(self.sensitivity['max_font_size'], fonts[font_type])
-            )
-        
-        scale = {
-            'factor': factor,
-            'class': class_name,
-            'level': level,
-            'header': fonts['header'],
-            'section': fonts['section'], 
-            'body': fonts['body'],
-            'small': fonts['small'],
-            'line_spacing': line_spacing,
-            'spacing_after': spacing_after,
-            'margins': margins
-        }
-        
-        print(f"🎯 Configurable scaling: {class_name} - Body: {fonts['body']}pt, Spacing: {spacing_after}pt")
+        logger.debug("Configurable scaling: %s - Body: %spt, Spacing: %spt", scale['class'], scale['body'], scale['spacing_after'])
         
         return scale
     
@@ -183,13 +321,11 @@ class ConfigurableAutoFitGenerator:
         Generate DOCX with configurable auto-fit scaling
         """
         try:
-            print("🎛️ Starting configurable auto-fit DOCX generation...")
-            
-            # Analyze content with sensitivity
-            analysis = self.analyze_content_with_sensitivity(markdown_text)
+            logger.debug("Starting configurable auto-fit DOCX generation...")
             
-            # Calculate scaling with configurable parameters
-            scaling = self.calculate_configurable_scaling(analysis)
+            # Analyze content and calculate scaling with configurable parameters, reusing
+            # earlier results for the same markdown and sensitivity settings
+            analysis, scaling = self._cached_analysis_and_scaling(markdown_text)
             
             # Clean markdown
             clean_markdown = self._clean_markdown(markdown_text)
@@ -198,12 +334,12 @@ class ConfigurableAutoFitGenerator:
             document = Document()
             
             # Set margins based on scaling
+            margin = Inches(scaling['margins'])
             for section in document.sections:
-                margin_inches = scaling['margins']
-                section.top_margin = Inches(margin_inches)
-                section.bottom_margin = Inches(margin_inches)
-                section.left_margin = Inches(margin_inches)
-                section.right_margin = Inches(margin_inches)
+                section.top_margin = margin
+                section.bottom_margin = margin
+                section.left_margin = margin
+                section.right_margin = margin
             
             # Setup styles with calculated font sizes
             self._setup_configurable_styles(document, scaling)
@@ -214,119 +350,122 @@ class ConfigurableAutoFitGenerator:
             # Generate and encode
             doc_buffer = io.BytesIO()
             document.save(doc_buffer)
-            doc_buffer.seek(0)
             
-            docx_base64 = base64.b64encode(doc_buffer.read()).decode('utf-8')
-            print(f"✅ Configurable auto-fit DOCX: {len(docx_base64)} chars, Level: {scaling['class']}")
+            # getbuffer() exposes the saved zip without copying it out again
+            docx_base64 = base64.b64encode(doc_buffer.getbuffer()).decode('ascii')
+            logger.debug("Configurable auto-fit DOCX: %d chars, Level: %s", len(docx_base64), scaling['class'])
             
             return docx_base64
             
         except Exception as e:
-            print(f"❌ Configurable auto-fit DOCX failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Configurable auto-fit DOCX failed: %s", e)
             raise
     
     def _clean_markdown(self, markdown_text: str) -> str:
         """Clean markdown for processing"""
-        text = markdown_text.strip()
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        text = re.sub(r'[ \t]+$', '', text, flags=re.MULTILINE)
-        return text
+        # One walk over the lines: runs of empty lines collapse to one, and every line is
+        # stripped so the content pass can use it as-is. Only truly empty lines count as
+        # blank, as with the former \n{3,} collapse.
+        lines = []
+        prev_empty = False
+        for line in markdown_text.strip().split('\n'):
+            if not line:
+                if prev_empty:
+                    continue
+                prev_empty = True
+                lines.append(line)
+            else:
+                prev_empty = False
+                lines.append(line.strip())
+        return '\n'.join(lines)
     
     def _setup_configurable_styles(self, document, scaling: Dict[str, Any]) -> None:
         """Setup document styles using configurable scaling"""
         styles = document.styles
+        spacing_pt = Pt(scaling['spacing_after'])
         
         # Normal style
         normal = styles['Normal']
         normal.font.name = 'Segoe UI'
         normal.font.size = Pt(scaling['body'])
         normal.font.color.rgb = self.text_color
-        normal.paragraph_format.space_after = Pt(scaling['spacing_after'])
+        normal.paragraph_format.space_after = spacing_pt
         normal.paragraph_format.line_spacing = scaling['line_spacing']
         
         # Header style
-        if 'ConfigurableHeader' not in [s.name for s in styles]:
-            header_style = styles.add_style('ConfigurableHeader', WD_STYLE_TYPE.PARAGRAPH)
-            header_style.font.name = 'Segoe UI'
-            header_style.font.size = Pt(scaling['header'])
-            header_style.font.bold = True
-            header_style.font.color.rgb = self.primary_color
-            header_style.paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-            header_style.paragraph_format.space_after = Pt(scaling['spacing_after'])
+        if 'ConfigurableHeader' not in styles:
+            styles.element.append(parse_xml(_PARAGRAPH_STYLE_XML.format(
+                style_id='ConfigurableHeader',
+                spacing='<w:spacing w:after="%d"/>' % spacing_pt.twips,
+                jc='<w:jc w:val="center"/>',
+                color=self.primary_color,
+                size=int(Pt(scaling['header']).pt * 2),
+            )))
         
         # Section style
-        if 'ConfigurableSection' not in [s.name for s in styles]:
-            section_style = styles.add_style('ConfigurableSection', WD_STYLE_TYPE.PARAGRAPH)
-            section_style.font.name = 'Segoe UI'
-            section_style.font.size = Pt(scaling['section'])
-            section_style.font.bold = True
-            section_style.font.color.rgb = self.secondary_color
-            section_style.paragraph_format.space_after = Pt(scaling['spacing_after'])
-            section_style.paragraph_format.space_before = Pt(scaling['spacing_after'] * 1.5)
+        if 'ConfigurableSection' not in styles:
+            styles.element.append(parse_xml(_PARAGRAPH_STYLE_XML.format(
+                style_id='ConfigurableSection',
+                spacing='<w:spacing w:after="%d" w:before="%d"/>' % (
+                    spacing_pt.twips, Pt(scaling['spacing_after'] * 1.5).twips),
+                jc='',
+                color=self.secondary_color,
+                size=int(Pt(scaling['section']).pt * 2),
+            )))
     
     def _process_content_with_scaling(self, document, markdown: str, scaling: Dict[str, Any]) -> None:
         """Process content with scaling applied"""
-        lines = markdown.split('\n')
+        spacing_pt = Pt(scaling['spacing_after'])
+        bullet_spacing_pt = Pt(scaling['spacing_after'] // 2)
         
-        for line in lines:
-            line = line.strip()
+        # Lines come stripped from _clean_markdown; split on '\n' only, as splitlines() would
+        # also break on \r, \f, \u2028, ... The marker remainders still need lstrip()
+        # for input like '#   Name'.
+        for line in markdown.split('\n'):
             if not line:
                 continue
-                
+            
             if line.startswith('# '):
                 # Main header
-                header_text = line[2:].strip()
+                header_text = line[2:].lstrip()
                 p = document.add_paragraph(header_text, style='ConfigurableHeader')
                 
             elif line.startswith('## '):
                 # Section header
-                section_text = line[3:].strip()
+                section_text = line[3:].lstrip()
                 p = document.add_paragraph(section_text, style='ConfigurableSection')
                 
             elif line.startswith(('- ', '• ', '* ')):
                 # Bullet point
-                bullet_text = re.sub(r'^[-•*]\s+', '', line)
+                bullet_text = line[1:].lstrip()
                 p = document.add_paragraph()
-                p.paragraph_format.space_after = Pt(scaling['spacing_after'] // 2)
+                p.paragraph_format.space_after = bullet_spacing_pt
                 p.add_run('• ')
                 self._add_rich_text(bullet_text, p)
                 
             else:
                 # Regular paragraph
                 p = document.add_paragraph()
-                p.paragraph_format.space_after = Pt(scaling['spacing_after'])
+                p.paragraph_format.space_after = spacing_pt
                 self._add_rich_text(line, p)
     
     def _add_rich_text(self, text: str, paragraph) -> None:
         """Add rich text with formatting"""
-        parts = re.split(r'(\*\*.*?\*\*|\*.*?\*|`.*?`)', text)
-        
-        for part in parts:
-            if not part:
-                continue
-                
-            run = paragraph.add_run()
-            
-            if part.startswith('**') and part.endswith('**') and len(part) > 4:
-                run.text = part[2:-2]
-                run.bold = True
-            elif part.startswith('*') and part.endswith('*') and len(part) > 2:
-                run.text = part[1:-1]
-                run.italic = True
-            elif part.startswith('`') and part.endswith('`') and len(part) > 2:
-                run.text = part[1:-1]
-                run.font.name = 'Consolas'
-            else:
-                run.text = part
+        p = paragraph._p
+        for kind, part in _tokenize_rich(text):
+            r = p.add_r()
+            rPr = _RUN_PROPERTIES.get(kind)
+            if rPr is not None:
+                r.append(deepcopy(rPr))
+            # CT_R.text keeps rPr and writes w:t/w:tab/w:br as Run.text would
+            r.text = part
 
 # PREDEFINED SENSITIVITY CONFIGURATIONS
 # You can use these or create your own
 
-SENSITIVITY_PROFILES = {
-    'conservative': {
-        # Very gentle scaling - keeps fonts larger
+def _conservative_profile() -> Dict[str, Any]:
+    """Very gentle scaling - keeps fonts larger"""
+    return {
         'short_resume_lines': 30,
         'medium_resume_lines': 50, 
         'long_resume_lines': 70,
@@ -342,10 +481,11 @@ SENSITIVITY_PROFILES = {
         'dense': {'header': 15, 'section': 10, 'body': 8, 'small': 7},
         'ultra_dense': {'header': 14, 'section': 9, 'body': 7, 'small': 6},
         'header_weight': 2.0, 'bullet_weight': 1.5, 'job_entry_weight': 2.5, 'word_weight': 0.10, 'line_weight': 1.0,
-    },
-    
-    'aggressive': {
-        # More aggressive scaling - shrinks fonts quickly  
+    }
+
+def _aggressive_profile() -> Dict[str, Any]:
+    """More aggressive scaling - shrinks fonts quickly"""
+    return {
         'short_resume_lines': 20,
         'medium_resume_lines': 30,
         'long_resume_lines': 45, 
@@ -361,10 +501,11 @@ SENSITIVITY_PROFILES = {
         'dense': {'header': 12, 'section': 8, 'body': 6, 'small': 5},
         'ultra_dense': {'header': 11, 'section': 7, 'body': 5, 'small': 5},
         'header_weight': 3.0, 'bullet_weight': 2.2, 'job_entry_weight': 3.5, 'word_weight': 0.15, 'line_weight': 1.4,
-    },
-    
-    'balanced': {
-        # Default balanced scaling
+    }
+
+def _balanced_profile() -> Dict[str, Any]:
+    """Default balanced scaling"""
+    return {
         'short_resume_lines': 25,
         'medium_resume_lines': 40,
         'long_resume_lines': 60,
@@ -381,8 +522,26 @@ SENSITIVITY_PROFILES = {
         'ultra_dense': {'header': 13, 'section': 8, 'body': 6, 'small': 5},
         'header_weight': 2.5, 'bullet_weight': 1.8, 'job_entry_weight': 3.0, 'word_weight': 0.12, 'line_weight': 1.2,
     }
+
+# Profile factories, so only the requested profile is built and each caller gets its own copy
+SENSITIVITY_PROFILES = {
+    'conservative': _conservative_profile,
+    'aggressive': _aggressive_profile,
+    'balanced': _balanced_profile,
 }
 
+def _generate_one(job: Tuple[str, str]) -> Tuple[str, Optional[int], Optional[str]]:
+    """
+    Generate a test resume with one sensitivity profile in a worker process.
+    Returns (profile_name, docx_base64_length, error).
+    """
+    profile_name, resume_content = job
+    try:
+        generator = ConfigurableAutoFitGenerator(SENSITIVITY_PROFILES[profile_name]())
+        return profile_name, len(generator.generate_configurable_docx_base64(resume_content)), None
+    except Exception as e:
+        return profile_name, None, str(e)
+
 # Test function with different sensitivity levels
 def test_sensitivity_levels():
     """Test different sensitivity configurations"""
@@ -416,17 +575,20 @@ sarah.johnson@email.com | (555) 987-6543
     print("🧪 Testing Different Sensitivity Levels")
     print("=" * 60)
     
-    for profile_name, config in SENSITIVITY_PROFILES.items():
+    # Profiles are independent, so generate them side by side, one worker process each
+    jobs = [(profile_name, test_resume) for profile_name in SENSITIVITY_PROFILES]
+    with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+        results = list(executor.map(_generate_one, jobs))
+    
+    for profile_name, docx_length, error in results:
         print(f"\n🎛️ Testing {profile_name.upper()} sensitivity:")
         print("-" * 30)
         
-        try:
-            generator = ConfigurableAutoFitGenerator(config)
-            result = generator.generate_configurable_docx_base64(test_resume)
-            print(f"✅ {profile_name.capitalize()}: {len(result):,} characters")
-            
-        except Exception as e:
-            print(f"❌ {profile_name.capitalize()} failed: {e}")
+        if error is not None:
+            print(f"❌ {profile_name.capitalize()} failed: {error}")
+            continue
+        
+        print(f"✅ {profile_name.capitalize()}: {docx_length:,} characters")
     
     print("\n" + "=" * 60)
     print("🎉 Sensitivity testing complete!")
@@ -436,4 +598,5 @@ sarah.johnson@email.com | (555) 987-6543
     print("   🚀 Aggressive: Shrinks fonts quickly, fits more content")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     test_sensitivity_levels()
\ No newline at end of file
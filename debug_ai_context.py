@@ -4,17 +4,14 @@ Debug script to test what the AI actually sees and returns
 """
 
 import asyncio
+import sys
+from typing import List, Optional, Tuple
 from models import ResumeData, UserProfile, Experience, Education, Project, ChatMessage, ChatRole
 from agents import DataGatheringAgent, OpenAIClient
 
-async def debug_ai_context():
-    """Debug what the AI actually sees and returns"""
-    
-    print("🔍 Debugging AI Context and Response")
-    print("=" * 50)
-    
-    # Create test data
-    existing_data = ResumeData(
+def _sample_resume_data() -> ResumeData:
+    """Existing resume data the probes run against"""
+    return ResumeData(
         profile=UserProfile(
             name="John Doe",
             email="john.doe@email.com",
@@ -33,8 +30,14 @@ async def debug_ai_context():
         ],
         skills=["Python", "JavaScript", "React"]
     )
+
+async def debug_ai_context(probes: List[Tuple[str, Optional[ResumeData]]]):
+    """Debug what the AI actually sees and returns for each (message, existing_data) probe"""
     
-    # Create agent
+    print("🔍 Debugging AI Context and Response")
+    print("=" * 50)
+    
+    # One client and agent shared by every probe
     client = OpenAIClient()
     agent = DataGatheringAgent(client)
     
@@ -44,19 +47,20 @@ async def debug_ai_context():
         ChatMessage(role=ChatRole.ASSISTANT, content="I'll create your resume")
     ]
     
-    print("📤 Sending to AI:")
-    print(f"   Message: 'Change my name to Jane Smith'")
-    print(f"   Existing Data: Name={existing_data.profile.name}, Skills={len(existing_data.skills)}, Experience={len(existing_data.experience)}")
-    print(f"   Chat History: {len(chat_history)} messages")
+    for message, existing_data in probes:
+        print("📤 Sending to AI:")
+        print(f"   Message: '{message}'")
+        if existing_data:
+            print(f"   Existing Data: Name={existing_data.profile.name}, Skills={len(existing_data.skills)}, Experience={len(existing_data.experience)}")
+        print(f"   Chat History: {len(chat_history)} messages")
     
-    try:
-        response, resume_data = await agent.process_message(
-            "Change my name to Jane Smith", 
-            chat_history, 
-            existing_data
-        )
-        
-        print(f"\n📥 AI Response:")
+    results = await asyncio.gather(*(
+        agent.process_message(message, chat_history, existing_data)
+        for message, existing_data in probes
+    ))
+    
+    for (message, _), (response, resume_data) in zip(probes, results):
+        print(f"\n📥 AI Response to '{message}':")
         print(f"   Message: {response}")
         print(f"   Resume Data Returned: {resume_data is not None}")
         
@@ -67,11 +71,9 @@ async def debug_ai_context():
             print(f"   Summary: {resume_data.summary}")
         else:
             print("   No resume data returned - AI did not trigger generation")
-            
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
 
 if __name__ == "__main__":
-    asyncio.run(debug_ai_context())
\ No newline at end of file
+    # Each command-line argument is one probe message
+    messages = sys.argv[1:] or ["Change my name to Jane Smith"]
+    existing_data = _sample_resume_data()
+    asyncio.run(debug_ai_context([(message, existing_data) for message in messages]))
\ No newline at end of file
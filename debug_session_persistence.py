@@ -10,6 +10,16 @@ from models import ResumeData, UserProfile, Experience, Education, Project, Chat
 from session_manager import SessionManager
 from agents import AIAgentOrchestrator
 
+def _summary(user_data: ResumeData, label: str = "") -> str:
+    """One indented line per section count, ready to print"""
+    return (
+        f"   👤 {label}Name: {user_data.profile.name}\n"
+        f"   💼 {label}Experience: {len(user_data.experience)} entries\n"
+        f"   🎓 {label}Education: {len(user_data.education)} entries\n"
+        f"   🚀 {label}Projects: {len(user_data.projects)} entries\n"
+        f"   ⚡ {label}Skills: {len(user_data.skills)} items"
+    )
+
 async def test_session_persistence():
     """Test if session data persists correctly through modifications"""
     
@@ -96,11 +106,7 @@ async def test_session_persistence():
     session = session_manager.get_session(session_id)
     if session and session.user_data:
         print(f"✅ Initial data stored successfully:")
-        print(f"   👤 Name: {session.user_data.profile.name}")
-        print(f"   💼 Experience entries: {len(session.user_data.experience)}")
-        print(f"   🎓 Education entries: {len(session.user_data.education)}") 
-        print(f"   🚀 Projects: {len(session.user_data.projects)}")
-        print(f"   ⚡ Skills: {len(session.user_data.skills)}")
+        print(_summary(session.user_data))
     else:
         print("❌ Failed to store initial data")
         return
@@ -112,9 +118,8 @@ async def test_session_persistence():
         ChatMessage(role=ChatRole.USER, content="Change my name to Jane Smith")
     ]
     
-    # Add chat messages to session
-    for msg in chat_history:
-        session_manager.add_chat_message(session_id, msg)
+    # Add chat messages to session in one update
+    session_manager.add_chat_messages(session_id, chat_history)
     
     print(f"\n2️⃣ Added {len(chat_history)} chat messages to history")
     
@@ -125,11 +130,7 @@ async def test_session_persistence():
     session_before = session_manager.get_session(session_id)
     print(f"📊 Before modification:")
     if session_before and session_before.user_data:
-        print(f"   👤 Name: {session_before.user_data.profile.name}")
-        print(f"   💼 Experience: {len(session_before.user_data.experience)} entries")
-        print(f"   🎓 Education: {len(session_before.user_data.education)} entries")
-        print(f"   🚀 Projects: {len(session_before.user_data.projects)} entries")
-        print(f"   ⚡ Skills: {len(session_before.user_data.skills)} items")
+        print(_summary(session_before.user_data))
     
     # Process the modification request
     response_text, updated_resume_data = await orchestrator.process_chat_message(
@@ -144,11 +145,7 @@ async def test_session_persistence():
     if updated_resume_data:
         print("\n⚠️  AI triggered full resume regeneration!")
         print("📊 Updated resume data:")
-        print(f"   👤 Name: {updated_resume_data.profile.name}")
-        print(f"   💼 Experience: {len(updated_resume_data.experience)} entries")
-        print(f"   🎓 Education: {len(updated_resume_data.education)} entries")
-        print(f"   🚀 Projects: {len(updated_resume_data.projects)} entries")
-        print(f"   ⚡ Skills: {len(updated_resume_data.skills)} items")
+        print(_summary(updated_resume_data))
         
         # Update session with new data
         session_manager.update_resume_data(session_id, updated_resume_data)
@@ -183,11 +180,7 @@ async def test_session_persistence():
     print("\n4️⃣ Final session state:")
     final_session = session_manager.get_session(session_id)
     if final_session and final_session.user_data:
-        print(f"   👤 Final Name: {final_session.user_data.profile.name}")
-        print(f"   💼 Final Experience: {len(final_session.user_data.experience)} entries")
-        print(f"   🎓 Final Education: {len(final_session.user_data.education)} entries")
-        print(f"   🚀 Final Projects: {len(final_session.user_data.projects)} entries")
-        print(f"   ⚡ Final Skills: {len(final_session.user_data.skills)} items")
+        print(_summary(final_session.user_data, "Final "))
         print(f"   💬 Chat History: {len(final_session.chat_history)} messages")
         
         # Check for data loss
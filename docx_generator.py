@@ -6,16 +6,94 @@ Generates high-quality, ATS-optimized Word documents with modern styling
 
 import re
 import base64
+import hashlib
 import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from itertools import repeat
 from typing import Optional, List, Dict, Any
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 from docx.enum.style import WD_STYLE_TYPE
-from docx.oxml.shared import OxmlElement, qn
 from docx.oxml.ns import nsdecls
 from docx.oxml import parse_xml
 
+# Inline markdown patterns, compiled once for the per-line cleanup in parse_markdown_to_docx
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.*?)\*')
+_CODE_RE = re.compile(r'`(.*?)`')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+
+# Section header border, parsed once and deep-copied onto each header
+_SECTION_BORDER = parse_xml(
+    '<w:pBdr %s w:bottom="single" w:sz="6" w:space="1" w:color="2c5aa0"/>' % nsdecls('w')
+)
+
+# Styles whose empty paragraph is captured as a template for parse_markdown_to_docx
+_PARAGRAPH_STYLES = ('ResumeHeader', 'ContactInfo', 'SectionHeader', 'BodyText', 'JobTitle', 'CompanyName')
+
+# Line heuristics: contact-info indicators, and section words that rule out a skills line
+_CONTACT_RE = re.compile(r'@|phone|linkedin|github|\(|\)|-', re.IGNORECASE)
+_NOT_SKILLS_RE = re.compile(r'experience|education|project', re.IGNORECASE)
+
+def _strip_md_chars(text: str) -> str:
+    """Delete every '*', '_' and '`'; three C-level replace passes beat both a regex and str.translate"""
+    return text.replace('*', '').replace('_', '').replace('`', '')
+
+def _first_group(match: re.Match) -> str:
+    """Replacement callback; cheaper than expanding an r'\\1' template per match"""
+    return match.group(1)
+
+def _strip_inline_markdown(text: str, links: bool = True) -> str:
+    """
+    Strip bold, italic, code and (optionally) link markup.
+
+    The passes stay ordered, as one alternation regex would match leftmost-first and
+    turn '* a **b**' into ' a b*'; each pass only runs when its pattern can match.
+    """
+    if text.count('**') > 1:
+        text = _BOLD_RE.sub(_first_group, text)    # Bold
+    if text.count('*') > 1:
+        text = _ITALIC_RE.sub(_first_group, text)  # Italic
+    if text.count('`') > 1:
+        text = _CODE_RE.sub(_first_group, text)    # Code
+    if links and '](' in text:
+        text = _LINK_RE.sub(_first_group, text)    # Links
+    return text
+
+# Rendered base64 DOCX per (generator style, markdown) digest, most recently used last.
+# Shared by all generators, so the key carries each generator's class and colors.
+_DOCX_CACHE_SIZE = 128
+_docx_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_docx_cache_lock = threading.Lock()
+
+def _cache_key(style_key: str, markdown_content: str) -> bytes:
+    """Digest identifying a markdown input rendered with a given style in the render cache"""
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(style_key.encode('utf-8'))
+    hasher.update(b'\0')
+    hasher.update(markdown_content.encode('utf-8'))
+    return hasher.digest()
+
+def _cache_get(key: bytes) -> Optional[str]:
+    """Return a cached render and mark it most recently used, or None"""
+    with _docx_cache_lock:
+        cached = _docx_cache.get(key)
+        if cached is not None:
+            _docx_cache.move_to_end(key)
+        return cached
+
+def _cache_put(key: bytes, docx_base64: str) -> None:
+    """Store a render, evicting the least recently used one past the size limit"""
+    with _docx_cache_lock:
+        _docx_cache[key] = docx_base64
+        if len(_docx_cache) > _DOCX_CACHE_SIZE:
+            _docx_cache.popitem(last=False)
+
 class ProfessionalDocxGenerator:
     """
     Professional DOCX generator with modern styling and ATS optimization
@@ -26,30 +104,82 @@ class ProfessionalDocxGenerator:
         self.text_color = RGBColor(51, 51, 51)      # Dark gray
         self.light_color = RGBColor(102, 102, 102)  # Light gray
         
+        # Serialized blank document with margins and custom styles, built on first use
+        self._template_bytes: Optional[bytes] = None
+        # Empty paragraph skeleton per style, deep-copied for every line the parser emits
+        self._paragraph_templates: Dict[str, Any] = {}
+        # Style key the template was built with; a color change rebuilds it
+        self._template_style_key: Optional[str] = None
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Batch workers receive the generator itself. The template caches (lxml elements
+        # can't be pickled) are rebuilt on the other side, and colors travel as plain
+        # tuples since RGBColor can't be unpickled
+        state = self.__dict__.copy()
+        state['_template_bytes'] = None
+        state['_paragraph_templates'] = {}
+        state['_template_style_key'] = None
+        state['_rgb_settings'] = [name for name, value in state.items() if isinstance(value, RGBColor)]
+        for name in state['_rgb_settings']:
+            state[name] = tuple(state[name])
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name in state.pop('_rgb_settings', ()):
+            state[name] = RGBColor(*state[name])
+        self.__dict__.update(state)
+    
+    def _style_key(self) -> str:
+        """Class and public settings (the colors) that determine the rendered output"""
+        settings = sorted((name, value) for name, value in vars(self).items() if not name.startswith('_'))
+        return f"{type(self).__module__}.{type(self).__qualname__}{settings!r}"
+    
+    def _get_template_bytes(self) -> bytes:
+        """Build the styled template document once and cache its serialized bytes"""
+        style_key = self._style_key()
+        if self._template_bytes is None or style_key != self._template_style_key:
+            self._template_style_key = style_key
+            doc = Document()
+            
+            # Set document margins (0.7 inches)
+            sections = doc.sections
+            for section in sections:
+                section.top_margin = Inches(0.7)
+                section.bottom_margin = Inches(0.7)
+                section.left_margin = Inches(0.7)
+                section.right_margin = Inches(0.7)
+            
+            # Create custom styles
+            self._create_custom_styles(doc)
+            
+            # Capture each style's paragraph skeleton through python-docx, then detach it
+            # before saving. Section headers carry their bottom border already.
+            for style_name in _PARAGRAPH_STYLES:
+                paragraph = doc.add_paragraph(style=style_name)
+                if style_name == 'SectionHeader':
+                    self._add_section_border(paragraph)
+                self._paragraph_templates[style_name] = paragraph._p
+                doc.element.body.remove(paragraph._p)
+            
+            template_buffer = io.BytesIO()
+            doc.save(template_buffer)
+            self._template_bytes = template_buffer.getvalue()
+        return self._template_bytes
+    
     def create_document(self) -> Document:
         """Create a new document with professional styling"""
-        doc = Document()
-        
-        # Set document margins (0.7 inches)
-        sections = doc.sections
-        for section in sections:
-            section.top_margin = Inches(0.7)
-            section.bottom_margin = Inches(0.7)
-            section.left_margin = Inches(0.7)
-            section.right_margin = Inches(0.7)
-        
-        # Create custom styles
-        self._create_custom_styles(doc)
-        
-        return doc
+        return Document(io.BytesIO(self._get_template_bytes()))
     
     def _create_custom_styles(self, doc: Document):
         """Create custom styles for professional formatting"""
         styles = doc.styles
+        # Names collected once; each guard is then a set lookup instead of a walk over all styles
+        existing = {s.name for s in styles}
         
         # Header style for name
-        if 'ResumeHeader' not in [s.name for s in styles]:
+        if 'ResumeHeader' not in existing:
             header_style = styles.add_style('ResumeHeader', WD_STYLE_TYPE.PARAGRAPH)
+            existing.add('ResumeHeader')
             header_font = header_style.font
             header_font.name = 'Segoe UI'
             header_font.size = Pt(20)
@@ -59,8 +189,9 @@ class ProfessionalDocxGenerator:
             header_style.paragraph_format.space_after = Pt(6)
         
         # Contact info style
-        if 'ContactInfo' not in [s.name for s in styles]:
+        if 'ContactInfo' not in existing:
             contact_style = styles.add_style('ContactInfo', WD_STYLE_TYPE.PARAGRAPH)
+            existing.add('ContactInfo')
             contact_font = contact_style.font
             contact_font.name = 'Segoe UI'
             contact_font.size = Pt(10)
@@ -69,8 +200,9 @@ class ProfessionalDocxGenerator:
             contact_style.paragraph_format.space_after = Pt(12)
         
         # Section header style
-        if 'SectionHeader' not in [s.name for s in styles]:
+        if 'SectionHeader' not in existing:
             section_style = styles.add_style('SectionHeader', WD_STYLE_TYPE.PARAGRAPH)
+            existing.add('SectionHeader')
             section_font = section_style.font
             section_font.name = 'Segoe UI'
             section_font.size = Pt(12)
@@ -82,8 +214,9 @@ class ProfessionalDocxGenerator:
             section_style.paragraph_format.keep_with_next = True
         
         # Body text style
-        if 'BodyText' not in [s.name for s in styles]:
+        if 'BodyText' not in existing:
             body_style = styles.add_style('BodyText', WD_STYLE_TYPE.PARAGRAPH)
+            existing.add('BodyText')
             body_font = body_style.font
             body_font.name = 'Segoe UI'
             body_font.size = Pt(10)
@@ -92,8 +225,9 @@ class ProfessionalDocxGenerator:
             body_style.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
         
         # Job title style
-        if 'JobTitle' not in [s.name for s in styles]:
+        if 'JobTitle' not in existing:
             job_style = styles.add_style('JobTitle', WD_STYLE_TYPE.PARAGRAPH)
+            existing.add('JobTitle')
             job_font = job_style.font
             job_font.name = 'Segoe UI'
             job_font.size = Pt(11)
@@ -102,8 +236,9 @@ class ProfessionalDocxGenerator:
             job_style.paragraph_format.space_after = Pt(3)
         
         # Company/Institution style
-        if 'CompanyName' not in [s.name for s in styles]:
+        if 'CompanyName' not in existing:
             company_style = styles.add_style('CompanyName', WD_STYLE_TYPE.PARAGRAPH)
+            existing.add('CompanyName')
             company_font = company_style.font
             company_font.name = 'Segoe UI'
             company_font.size = Pt(10)
@@ -115,19 +250,36 @@ class ProfessionalDocxGenerator:
         """Add a bottom border to section headers"""
         p = paragraph._element
         pPr = p.get_or_add_pPr()
-        pBdr = OxmlElement('w:pBdr')
-        pBdr.set(qn('w:bottom'), 'single')
-        pBdr.set(qn('w:sz'), '6')
-        pBdr.set(qn('w:space'), '1')
-        pBdr.set(qn('w:color'), '2c5aa0')
-        pPr.append(pBdr)
+        pPr.append(deepcopy(_SECTION_BORDER))
     
     def parse_markdown_to_docx(self, markdown_content: str) -> Document:
         """Convert markdown resume to professional DOCX format"""
         doc = self.create_document()
-        lines = markdown_content.strip().split('\n')
+        # Split without first copying a stripped version of the whole text; leading blank
+        # lines are skipped by index, so the name header and the contact window still count
+        # from the first non-blank line. Only '\n' splits, as splitlines() would also break
+        # on \r, \f, \u2028, ...
+        lines = markdown_content.split('\n')
+        start = 0
+        while start < len(lines) and not lines[start].strip():
+            start += 1
+        
+        # Paragraphs are cloned from the per-style template w:p, skipping add_paragraph's
+        # proxy objects and per-call style lookup, and buffered; they are inserted ahead of
+        # the section properties in one splice once parsing is done
+        templates = self._paragraph_templates
+        paragraphs = []
         
-        i = 0
+        def add_paragraph(text: str, style_name: str) -> None:
+            p = deepcopy(templates[style_name])
+            if text:
+                p.add_r().text = text  # CT_R converts tabs and line breaks like Run.text does
+            paragraphs.append(p)
+        
+        def add_body_text(text: str) -> None:
+            add_paragraph(text, 'BodyText')
+        
+        i = start
         while i < len(lines):
             line = lines[i].strip()
             
@@ -135,82 +287,124 @@ class ProfessionalDocxGenerator:
                 i += 1
                 continue
             
+            # Classify on the first character, so most lines take one comparison instead of
+            # the whole startswith/endswith chain
+            head = line[0]
+            if head == '#':
+                if i == start and line.startswith('# '):
+                    kind = 'h1'
+                elif line.startswith('## '):
+                    kind = 'h2'
+                else:
+                    kind = 'text'
+            elif head == '*':
+                if line.endswith('**') and line.startswith('**'):
+                    kind = 'job'
+                elif line.endswith('*') and line[1:2] != '*':
+                    kind = 'company'
+                else:
+                    kind = 'text'
+            elif (head == '-' or head == '•') and line[1:2] == ' ':
+                kind = 'bullet'
+            else:
+                kind = 'text'
+            i += 1
+            
             # Main header (name)
-            if line.startswith('# ') and i == 0:
+            if kind == 'h1':
                 name = line[2:].strip()
-                header_para = doc.add_paragraph(name, style='ResumeHeader')
-                i += 1
+                add_paragraph(name, 'ResumeHeader')
                 
                 # Look for contact info in next few lines
                 contact_parts = []
-                while i < len(lines) and i < 5:  # Check next 5 lines for contact info
+                while i < len(lines) and i < start + 5:  # Check next 5 lines for contact info
                     next_line = lines[i].strip()
                     if not next_line or next_line.startswith('#'):
                         break
                     # Remove markdown formatting and collect contact info
-                    clean_line = re.sub(r'[*_`]', '', next_line)
-                    if any(indicator in clean_line.lower() for indicator in ['@', 'phone', 'linkedin', 'github', '(', ')', '-']):
+                    clean_line = _strip_md_chars(next_line)
+                    if _CONTACT_RE.search(clean_line):
                         contact_parts.append(clean_line)
                     i += 1
                 
                 # Add contact info as single line
                 if contact_parts:
                     contact_info = ' | '.join(contact_parts)
-                    doc.add_paragraph(contact_info, style='ContactInfo')
+                    add_paragraph(contact_info, 'ContactInfo')
             
             # Section headers
-            elif line.startswith('## '):
+            elif kind == 'h2':
                 section_name = line[3:].strip()
-                section_para = doc.add_paragraph(section_name, style='SectionHeader')
-                self._add_section_border(section_para)
-                i += 1
+                add_paragraph(section_name, 'SectionHeader')  # template carries the border
             
             # Job/Project titles (bold lines)
-            elif line.startswith('**') and line.endswith('**'):
+            elif kind == 'job':
                 title = line[2:-2].strip()
-                doc.add_paragraph(title, style='JobTitle')
-                i += 1
+                add_paragraph(title, 'JobTitle')
             
             # Company/Institution info (italic lines)
-            elif line.startswith('*') and line.endswith('*') and not line.startswith('**'):
+            elif kind == 'company':
                 company = line[1:-1].strip()
-                doc.add_paragraph(company, style='CompanyName')
-                i += 1
+                add_paragraph(company, 'CompanyName')
             
             # Bullet points
-            elif line.startswith('- ') or line.startswith('• '):
-                bullet_text = line[2:].strip()
+            elif kind == 'bullet':
+                bullet_text = line[2:].lstrip()  # line is already stripped on the right
                 # Remove markdown formatting
-                clean_text = re.sub(r'\*\*(.*?)\*\*', r'\1', bullet_text)  # Bold
-                clean_text = re.sub(r'\*(.*?)\*', r'\1', clean_text)      # Italic
-                clean_text = re.sub(r'`(.*?)`', r'\1', clean_text)        # Code
+                clean_text = _strip_inline_markdown(bullet_text, links=False)
                 
-                para = doc.add_paragraph(style='BodyText')
-                run = para.runs[0] if para.runs else para.add_run()
-                run.text = f"• {clean_text}"
-                i += 1
+                add_body_text('• ' + clean_text)
             
             # Skills (comma-separated)
-            elif ',' in line and not any(x in line.lower() for x in ['experience', 'education', 'project']):
+            elif ',' in line and not _NOT_SKILLS_RE.search(line):
                 # This might be a skills line
-                skills_text = re.sub(r'[*_`]', '', line)  # Remove markdown
-                doc.add_paragraph(skills_text, style='BodyText')
-                i += 1
+                skills_text = _strip_md_chars(line)  # Remove markdown
+                add_body_text(skills_text)
             
             # Regular text
             else:
                 # Clean markdown formatting
-                clean_text = re.sub(r'\*\*(.*?)\*\*', r'\1', line)  # Bold
-                clean_text = re.sub(r'\*(.*?)\*', r'\1', clean_text)  # Italic
-                clean_text = re.sub(r'`(.*?)`', r'\1', clean_text)    # Code
-                clean_text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', clean_text)  # Links
+                clean_text = _strip_inline_markdown(line)
                 
                 if clean_text.strip():
-                    doc.add_paragraph(clean_text, style='BodyText')
-                i += 1
+                    add_body_text(clean_text)
         
+        body = doc.element.body
+        sect_pr = body.sectPr
+        position = body.index(sect_pr) if sect_pr is not None else len(body)
+        body[position:position] = paragraphs
         return doc
     
+    def _render_docx(self, markdown_content: str) -> io.BytesIO:
+        """Build the document and save it into an in-memory buffer"""
+        doc = self.parse_markdown_to_docx(markdown_content)
+        docx_buffer = io.BytesIO()
+        doc.save(docx_buffer)
+        return docx_buffer
+    
+    def generate_docx_bytes(self, markdown_content: str) -> Optional[bytes]:
+        """
+        Generate DOCX from markdown and return the raw .docx payload
+        
+        Preferred for binary pipelines (file writes, HTTP responses served as
+        application/vnd.openxmlformats-officedocument.wordprocessingml.document),
+        which skip base64's 4/3 size overhead
+        
+        Args:
+            markdown_content: Markdown formatted resume content
+            
+        Returns:
+            DOCX content or None if generation fails
+        """
+        try:
+            docx_bytes = self._render_docx(markdown_content).getvalue()
+            print(f"DOCX generated successfully, size: {len(docx_bytes)} bytes")
+            return docx_bytes
+            
+        except Exception as e:
+            print(f"Error generating DOCX: {e}")
+            return None
+    
     def generate_docx_base64(self, markdown_content: str) -> Optional[str]:
         """
         Generate DOCX from markdown and return as base64 string
@@ -221,24 +415,51 @@ class ProfessionalDocxGenerator:
         Returns:
             Base64 encoded DOCX content or None if generation fails
         """
+        key = _cache_key(self._style_key(), markdown_content)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+        
         try:
-            doc = self.parse_markdown_to_docx(markdown_content)
-            
-            # Save to bytes buffer
-            docx_buffer = io.BytesIO()
-            doc.save(docx_buffer)
-            docx_buffer.seek(0)
+            docx_buffer = self._render_docx(markdown_content)
             
-            # Convert to base64
-            docx_base64 = base64.b64encode(docx_buffer.read()).decode('utf-8')
+            # Convert to base64 straight from the buffer's memoryview, without copying it out
+            docx_base64 = base64.b64encode(docx_buffer.getbuffer()).decode('ascii')
             
             print(f"DOCX generated successfully, size: {len(docx_base64)} characters")
+            
+            _cache_put(key, docx_base64)
             return docx_base64
             
         except Exception as e:
             print(f"Error generating DOCX: {e}")
             return None
     
+    def generate_docx_base64_batch(self, markdown_contents: List[str]) -> List[Optional[str]]:
+        """
+        Generate many DOCX documents in parallel, one worker process per core
+        
+        Args:
+            markdown_contents: Markdown formatted resume contents
+            
+        Returns:
+            Base64 encoded DOCX content per input, in input order (None where generation fails)
+        """
+        style_key = self._style_key()
+        keys = [_cache_key(style_key, markdown_content) for markdown_content in markdown_contents]
+        results = [_cache_get(key) for key in keys]
+        
+        # Only renders missing from this process's cache go to the workers
+        misses = [i for i, result in enumerate(results) if result is None]
+        if misses:
+            rendered = _get_batch_executor().map(
+                _generate_in_worker, repeat(self), [markdown_contents[i] for i in misses], chunksize=4)
+            for i, docx_base64 in zip(misses, rendered):
+                results[i] = docx_base64
+                if docx_base64 is not None:
+                    _cache_put(keys[i], docx_base64)
+        return results
+    
     def save_docx_file(self, markdown_content: str, filename: str = "resume.docx") -> bool:
         """
         Generate and save DOCX file to disk
@@ -251,8 +472,29 @@ class ProfessionalDocxGenerator:
             True if successful, False otherwise
         """
         try:
-            doc = self.parse_markdown_to_docx(markdown_content)
-            doc.save(filename)
+            doc_buffer = self._render_docx(markdown_content)
+        except Exception as e:
+            print(f"Error saving DOCX file: {e}")
+            return False
+        return self.save_docx_bytes(doc_buffer.getbuffer(), filename)
+    
+    def save_docx_bytes(self, docx_bytes: bytes, filename: str = "resume.docx") -> bool:
+        """
+        Save an already rendered DOCX payload to disk
+        
+        Writes the bytes as-is, so callers holding output from
+        generate_docx_bytes (or a decoded base64 string) skip a second render
+        
+        Args:
+            docx_bytes: DOCX content
+            filename: Output filename
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with open(filename, 'wb') as f:
+                f.write(docx_bytes)
             print(f"DOCX saved successfully as {filename}")
             return True
             
@@ -260,6 +502,37 @@ class ProfessionalDocxGenerator:
             print(f"Error saving DOCX file: {e}")
             return False
 
+# Shared generator; its template document and colors are built once per process.
+# Prefer these free functions over constructing ProfessionalDocxGenerator per request.
+_default_generator = ProfessionalDocxGenerator()
+generate_docx_base64 = _default_generator.generate_docx_base64
+generate_docx_bytes = _default_generator.generate_docx_bytes
+save_docx_file = _default_generator.save_docx_file
+save_docx_bytes = _default_generator.save_docx_bytes
+
+# Worker pool for batch generation, started on first use
+_batch_executor: Optional[ProcessPoolExecutor] = None
+_batch_executor_lock = threading.Lock()
+# Per-process generators keyed by style, so each style's template is built once per worker
+_worker_generators: Dict[str, ProfessionalDocxGenerator] = {}
+
+def _init_batch_worker() -> None:
+    """Build the shared generator's template once per worker process"""
+    _default_generator._get_template_bytes()
+    _worker_generators[_default_generator._style_key()] = _default_generator
+
+def _generate_in_worker(generator: ProfessionalDocxGenerator, markdown_content: str) -> Optional[str]:
+    """Generate one DOCX in a worker process with the caller's generator settings"""
+    return _worker_generators.setdefault(generator._style_key(), generator).generate_docx_base64(markdown_content)
+
+def _get_batch_executor() -> ProcessPoolExecutor:
+    """Return the shared worker pool, creating it on first use"""
+    global _batch_executor
+    with _batch_executor_lock:
+        if _batch_executor is None:
+            _batch_executor = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_batch_worker)
+        return _batch_executor
+
 # Test function
 def test_docx_generation():
     """Test the DOCX generation with sample data"""
@@ -310,17 +583,15 @@ Experienced software engineer with 5+ years in full-stack development, specializ
 - GitHub: github.com/johndoe/ecommerce-platform
 """
 
-    generator = ProfessionalDocxGenerator()
-    
     # Test base64 generation
-    docx_base64 = generator.generate_docx_base64(sample_markdown)
+    docx_base64 = generate_docx_base64(sample_markdown)
     if docx_base64:
         print(f"✅ Base64 generation successful, length: {len(docx_base64)}")
     else:
         print("❌ Base64 generation failed")
     
     # Test file saving
-    success = generator.save_docx_file(sample_markdown, "test_resume.docx")
+    success = save_docx_file(sample_markdown, "test_resume.docx")
     if success:
         print("✅ File saving successful")
     else:
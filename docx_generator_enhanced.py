@@ -6,25 +6,62 @@ Fixed parsing issues and enhanced markdown support
 
 import re
 import base64
+import hashlib
 import io
+import threading
+from collections import OrderedDict
+from copy import deepcopy
 from typing import Optional, List, Dict, Any
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 from docx.enum.style import WD_STYLE_TYPE
-from docx.oxml.shared import OxmlElement, qn
+from docx.text.paragraph import Paragraph
 from docx.oxml.ns import nsdecls
 from docx.oxml import parse_xml
 
+# Inline markdown spans for _parse_rich_text; the group name tells which kind matched
+_MD_TOKEN_RE = re.compile(r'(?P<bold>\*\*.*?\*\*)|(?P<italic>\*.*?\*)|(?P<code>`.*?`)|(?P<link>\[.*?\]\(.*?\))')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_NUM_LIST_RE = re.compile(r'^(\d+)\.\s+')
+# Contact line cleanup
+_LEAD_STAR_RE = re.compile(r'^\*+\s*')
+_TRAIL_STAR_RE = re.compile(r'\s*\*+$')
+_CODE_INLINE_RE = re.compile(r'`([^`]+)`')
+_CONTACT_RE = re.compile(r'@|phone|linkedin|github|\(|\)|-|\+|http|www|\.com|\.org', re.IGNORECASE)
+
+# Colors and sizes are immutable value types, so one shared instance of each serves every run
+_PRIMARY_COLOR = RGBColor(44, 90, 160)  # Professional blue
+_TEXT_COLOR = RGBColor(51, 51, 51)      # Dark gray
+_LIGHT_COLOR = RGBColor(102, 102, 102)  # Light gray
+_LINK_COLOR = RGBColor(0, 0, 238)       # Blue color for links
+_CODE_FONT_SIZE = Pt(9)
+
+# Section header border, parsed once and deep-copied onto each header
+_SECTION_BORDER = parse_xml(
+    '<w:pBdr %s w:bottom="single" w:sz="6" w:space="1" w:color="2c5aa0"/>' % nsdecls('w')
+)
+
+# Styles whose empty paragraph is captured as a template for parse_markdown_to_docx
+_PARAGRAPH_STYLES = ('ResumeHeader', 'ContactInfo', 'SectionHeader', 'BodyText', 'JobTitle', 'CompanyName')
+
+# Serialized DOCX per markdown digest, most recently used last. Styling is fixed, so the
+# bytes depend only on the markdown; base64 output and file saves both read from here.
+_RENDER_CACHE_SIZE = 8
+_render_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+_render_cache_lock = threading.Lock()
+
 class EnhancedDocxGenerator:
     """
     Enhanced DOCX generator with improved markdown parsing and professional styling
     """
     
     def __init__(self):
-        self.primary_color = RGBColor(44, 90, 160)  # Professional blue
-        self.text_color = RGBColor(51, 51, 51)      # Dark gray
-        self.light_color = RGBColor(102, 102, 102)  # Light gray
+        self.primary_color = _PRIMARY_COLOR
+        self.text_color = _TEXT_COLOR
+        self.light_color = _LIGHT_COLOR
+        # Empty paragraph skeleton per style, built on first use
+        self._paragraph_templates: Optional[Dict[str, Any]] = None
         
     def create_document(self) -> Document:
         """Create a new document with professional styling"""
@@ -46,10 +83,13 @@ class EnhancedDocxGenerator:
     def _create_custom_styles(self, doc: Document):
         """Create custom styles for professional formatting"""
         styles = doc.styles
+        # Style names gathered a single time rather than re-listed for every guard below
+        existing = {s.name for s in styles}
         
         # Header style for name
-        if 'ResumeHeader' not in [s.name for s in styles]:
+        if 'ResumeHeader' not in existing:
             header_style = styles.add_style('ResumeHeader', WD_STYLE_TYPE.PARAGRAPH)
+            existing.add('ResumeHeader')
             header_font = header_style.font
             header_font.name = 'Segoe UI'
             header_font.size = Pt(20)
@@ -59,8 +99,9 @@ class EnhancedDocxGenerator:
             header_style.paragraph_format.space_after = Pt(6)
         
         # Contact info style
-        if 'ContactInfo' not in [s.name for s in styles]:
+        if 'ContactInfo' not in existing:
             contact_style = styles.add_style('ContactInfo', WD_STYLE_TYPE.PARAGRAPH)
+            existing.add('ContactInfo')
             contact_font = contact_style.font
             contact_font.name = 'Segoe UI'
             contact_font.size = Pt(10)
@@ -69,8 +110,9 @@ class EnhancedDocxGenerator:
             contact_style.paragraph_format.space_after = Pt(12)
         
         # Section header style
-        if 'SectionHeader' not in [s.name for s in styles]:
+        if 'SectionHeader' not in existing:
             section_style = styles.add_style('SectionHeader', WD_STYLE_TYPE.PARAGRAPH)
+            existing.add('SectionHeader')
             section_font = section_style.font
             section_font.name = 'Segoe UI'
             section_font.size = Pt(12)
@@ -81,8 +123,9 @@ class EnhancedDocxGenerator:
             section_style.paragraph_format.keep_with_next = True
         
         # Body text style
-        if 'BodyText' not in [s.name for s in styles]:
+        if 'BodyText' not in existing:
             body_style = styles.add_style('BodyText', WD_STYLE_TYPE.PARAGRAPH)
+            existing.add('BodyText')
             body_font = body_style.font
             body_font.name = 'Segoe UI'
             body_font.size = Pt(10)
@@ -91,8 +134,9 @@ class EnhancedDocxGenerator:
             body_style.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
         
         # Job title style
-        if 'JobTitle' not in [s.name for s in styles]:
+        if 'JobTitle' not in existing:
             job_style = styles.add_style('JobTitle', WD_STYLE_TYPE.PARAGRAPH)
+            existing.add('JobTitle')
             job_font = job_style.font
             job_font.name = 'Segoe UI'
             job_font.size = Pt(11)
@@ -101,8 +145,9 @@ class EnhancedDocxGenerator:
             job_style.paragraph_format.space_after = Pt(3)
         
         # Company/Institution style
-        if 'CompanyName' not in [s.name for s in styles]:
+        if 'CompanyName' not in existing:
             company_style = styles.add_style('CompanyName', WD_STYLE_TYPE.PARAGRAPH)
+            existing.add('CompanyName')
             company_font = company_style.font
             company_font.name = 'Segoe UI'
             company_font.size = Pt(10)
@@ -110,80 +155,132 @@ class EnhancedDocxGenerator:
             company_font.color.rgb = self.light_color
             company_style.paragraph_format.space_after = Pt(6)
     
+    def _get_paragraph_templates(self) -> Dict[str, Any]:
+        """Capture each style's empty w:p once, from a throwaway styled document"""
+        if self._paragraph_templates is None:
+            doc = self.create_document()
+            templates = {}
+            for style_name in _PARAGRAPH_STYLES:
+                paragraph = doc.add_paragraph(style=style_name)
+                if style_name == 'SectionHeader':
+                    self._add_section_border(paragraph)
+                templates[style_name] = paragraph._p
+            self._paragraph_templates = templates
+        return self._paragraph_templates
+    
     def _add_section_border(self, paragraph):
         """Add a bottom border to section headers"""
         p = paragraph._element
         pPr = p.get_or_add_pPr()
-        pBdr = OxmlElement('w:pBdr')
-        pBdr.set(qn('w:bottom'), 'single')
-        pBdr.set(qn('w:sz'), '6')
-        pBdr.set(qn('w:space'), '1')
-        pBdr.set(qn('w:color'), '2c5aa0')
-        pPr.append(pBdr)
+        pPr.append(deepcopy(_SECTION_BORDER))
     
     def _parse_rich_text(self, text: str, paragraph):
         """Parse text with markdown formatting and add to paragraph with proper styling"""
         # Handle bold, italic, and code formatting while preserving the formatting in Word
         
-        # Split by markdown patterns while keeping the delimiters
-        parts = re.split(r'(\*\*.*?\*\*|\*.*?\*|`.*?`|\[.*?\]\(.*?\))', text)
-        
-        for part in parts:
-            if not part:
-                continue
-                
+        # One pass over the text: plain stretches between matches become regular runs, and
+        # each match is styled by the alternative that matched it
+        position = 0
+        for match in _MD_TOKEN_RE.finditer(text):
+            start = match.start()
+            if start > position:
+                paragraph.add_run().text = text[position:start]
+            position = match.end()
+            
+            part = match.group()
+            kind = match.lastgroup
             run = paragraph.add_run()
             
             # Bold text (**text**)
-            if part.startswith('**') and part.endswith('**') and len(part) > 4:
+            if kind == 'bold' and len(part) > 4:
                 run.text = part[2:-2]
                 run.bold = True
-            # Italic text (*text*)
-            elif part.startswith('*') and part.endswith('*') and len(part) > 2 and not part.startswith('**'):
+            # Italic text (*text*); an italic match of length 2 is a bare '**'
+            elif kind == 'italic' and len(part) > 2:
                 run.text = part[1:-1]
                 run.italic = True
             # Code text (`text`)
-            elif part.startswith('`') and part.endswith('`') and len(part) > 2:
+            elif kind == 'code' and len(part) > 2:
                 run.text = part[1:-1]
                 run.font.name = 'Consolas'
-                run.font.size = Pt(9)
+                run.font.size = _CODE_FONT_SIZE
             # Links [text](url)
-            elif re.match(r'\[.*?\]\(.*?\)', part):
-                link_match = re.match(r'\[([^\]]+)\]\([^)]+\)', part)
+            elif kind == 'link':
+                link_match = _LINK_RE.match(part)
                 if link_match:
                     run.text = link_match.group(1)
-                    run.font.color.rgb = RGBColor(0, 0, 238)  # Blue color for links
+                    run.font.color.rgb = _LINK_COLOR
                 else:
                     run.text = part
-            # Regular text
+            # Regular text, including empty markers such as '****' or '``'
             else:
                 run.text = part
+        
+        if position < len(text):
+            paragraph.add_run().text = text[position:]
     
     def parse_markdown_to_docx(self, markdown_content: str) -> Document:
         """Enhanced markdown parsing with better formatting support"""
         doc = self.create_document()
         lines = markdown_content.strip().split('\n')
         
+        # Paragraphs are cloned from per-style template w:p elements and buffered, then
+        # spliced into the body in one step at the end instead of one add_paragraph per line
+        templates = self._get_paragraph_templates()
+        parent = doc._body
+        paragraphs = []
+        
+        def add_paragraph(text: str, style_name: str) -> Any:
+            p = deepcopy(templates[style_name])
+            if text:
+                p.add_r().text = text
+            paragraphs.append(p)
+            return p
+        
+        def add_rich_paragraph() -> Paragraph:
+            return Paragraph(add_paragraph('', 'BodyText'), parent)
+        
         i = 0
-        skip_empty_lines = False
         
         while i < len(lines):
             line = lines[i].strip()
             
-            # Skip empty lines except when we want to preserve spacing
             if not line:
-                if not skip_empty_lines:
-                    # Add small spacing
-                    pass
                 i += 1
                 continue
             
-            # Main header (name) - must be first line
-            if line.startswith('# ') and i < 3:  # Allow some flexibility for position
+            # Classify on the first character, so most lines take one or two comparisons
+            # instead of the whole startswith/endswith/regex chain
+            head = line[0]
+            kind = 'text'
+            if head == '#':
+                # Main header (name) - must be first line; allow some flexibility for position
+                if i < 3 and line.startswith('# '):
+                    kind = 'h1'
+                elif line.startswith('## '):
+                    kind = 'h2'
+            elif head == '*':
+                second = line[1:2]
+                if second == '*':
+                    if len(line) > 4 and line.endswith('**'):
+                        kind = 'job'
+                elif len(line) > 2 and line.endswith('*'):
+                    kind = 'company'
+                elif second == ' ':
+                    kind = 'bullet'
+            elif head == '-' or head == '•':
+                if line[1:2] == ' ':
+                    kind = 'bullet'
+            elif head.isdigit():
+                number_match = _NUM_LIST_RE.match(line)
+                if number_match:
+                    kind = 'number'
+            i += 1
+            
+            # Main header (name)
+            if kind == 'h1':
                 name = line[2:].strip()
-                header_para = doc.add_paragraph(name, style='ResumeHeader')
-                i += 1
-                skip_empty_lines = True
+                add_paragraph(name, 'ResumeHeader')
                 
                 # Look for contact info in next few lines
                 contact_parts = []
@@ -197,12 +294,11 @@ class EnhancedDocxGenerator:
                         break
                     
                     # Check if this looks like contact info
-                    contact_indicators = ['@', 'phone', 'linkedin', 'github', '(', ')', '-', '+', 'http', 'www', '.com', '.org']
-                    if any(indicator in next_line.lower() for indicator in contact_indicators):
+                    if _CONTACT_RE.search(next_line):
                         # Clean up the line but preserve important formatting
-                        clean_line = re.sub(r'^\*+\s*', '', next_line)  # Remove leading asterisks
-                        clean_line = re.sub(r'\s*\*+$', '', clean_line)  # Remove trailing asterisks
-                        clean_line = re.sub(r'`([^`]+)`', r'\1', clean_line)  # Remove code formatting
+                        clean_line = _LEAD_STAR_RE.sub('', next_line)  # Remove leading asterisks
+                        clean_line = _TRAIL_STAR_RE.sub('', clean_line)  # Remove trailing asterisks
+                        clean_line = _CODE_INLINE_RE.sub(r'\1', clean_line)  # Remove code formatting
                         contact_parts.append(clean_line)
                         contact_lines += 1
                     else:
@@ -212,74 +308,76 @@ class EnhancedDocxGenerator:
                 # Add contact info as single line
                 if contact_parts:
                     contact_info = ' | '.join(contact_parts)
-                    doc.add_paragraph(contact_info, style='ContactInfo')
-                
-                skip_empty_lines = False
+                    add_paragraph(contact_info, 'ContactInfo')
             
             # Section headers (## text)
-            elif line.startswith('## '):
+            elif kind == 'h2':
                 section_name = line[3:].strip()
-                section_para = doc.add_paragraph(section_name, style='SectionHeader')
-                self._add_section_border(section_para)
-                i += 1
-                skip_empty_lines = True
+                add_paragraph(section_name, 'SectionHeader')  # template carries the border
             
             # Job/Project titles (bold lines starting with **)
-            elif line.startswith('**') and line.endswith('**') and len(line) > 4:
+            elif kind == 'job':
                 title = line[2:-2].strip()
-                doc.add_paragraph(title, style='JobTitle')
-                i += 1
+                add_paragraph(title, 'JobTitle')
             
             # Company/Institution info (italic lines with single *)
-            elif (line.startswith('*') and line.endswith('*') and 
-                  not line.startswith('**') and len(line) > 2):
+            elif kind == 'company':
                 company = line[1:-1].strip()
-                doc.add_paragraph(company, style='CompanyName')
-                i += 1
+                add_paragraph(company, 'CompanyName')
             
             # Bullet points
-            elif line.startswith(('- ', '• ', '* ')):
+            elif kind == 'bullet':
                 bullet_text = line[2:].strip()
-                para = doc.add_paragraph(style='BodyText')
+                para = add_rich_paragraph()
                 
                 # Add bullet point
-                bullet_run = para.add_run('• ')
+                para.add_run('• ')
                 
                 # Parse the rest with rich text formatting
                 self._parse_rich_text(bullet_text, para)
-                i += 1
             
             # Numbered lists
-            elif re.match(r'^\d+\.\s+', line):
-                list_text = re.sub(r'^\d+\.\s+', '', line)
-                para = doc.add_paragraph(style='BodyText')
+            elif kind == 'number':
+                list_text = line[number_match.end():]
+                para = add_rich_paragraph()
                 
                 # Add number
-                number_match = re.match(r'^(\d+)\.\s+', line)
-                if number_match:
-                    num_run = para.add_run(f'{number_match.group(1)}. ')
+                para.add_run(f'{number_match.group(1)}. ')
                 
                 # Parse the rest with rich text formatting
                 self._parse_rich_text(list_text, para)
-                i += 1
             
-            # Skills and other comma-separated content
-            elif (',' in line and 
-                  not any(header in line.lower() for header in ['experience', 'education', 'project', 'summary']) and
-                  not line.startswith('#')):
-                para = doc.add_paragraph(style='BodyText')
-                self._parse_rich_text(line, para)
-                i += 1
-            
-            # Regular paragraphs
+            # Regular paragraphs, including skills and other comma-separated content
             else:
-                if line.strip():
-                    para = doc.add_paragraph(style='BodyText')
-                    self._parse_rich_text(line, para)
-                i += 1
+                para = add_rich_paragraph()
+                self._parse_rich_text(line, para)
         
+        body = doc.element.body
+        sect_pr = body.sectPr
+        position = body.index(sect_pr) if sect_pr is not None else len(body)
+        body[position:position] = paragraphs
         return doc
     
+    def _render_bytes(self, markdown_content: str) -> bytes:
+        """Parse and serialize the markdown, reusing a recent render of the same input"""
+        key = hashlib.blake2b(markdown_content.encode('utf-8'), digest_size=16).digest()
+        with _render_cache_lock:
+            cached = _render_cache.get(key)
+            if cached is not None:
+                _render_cache.move_to_end(key)
+                return cached
+        
+        doc = self.parse_markdown_to_docx(markdown_content)
+        docx_buffer = io.BytesIO()
+        doc.save(docx_buffer)
+        docx_bytes = docx_buffer.getvalue()
+        
+        with _render_cache_lock:
+            _render_cache[key] = docx_bytes
+            if len(_render_cache) > _RENDER_CACHE_SIZE:
+                _render_cache.popitem(last=False)
+        return docx_bytes
+    
     def generate_docx_base64(self, markdown_content: str) -> Optional[str]:
         """
         Generate DOCX from markdown and return as base64 string
@@ -291,15 +389,8 @@ class EnhancedDocxGenerator:
             Base64 encoded DOCX content or None if generation fails
         """
         try:
-            doc = self.parse_markdown_to_docx(markdown_content)
-            
-            # Save to bytes buffer
-            docx_buffer = io.BytesIO()
-            doc.save(docx_buffer)
-            docx_buffer.seek(0)
-            
             # Convert to base64
-            docx_base64 = base64.b64encode(docx_buffer.read()).decode('utf-8')
+            docx_base64 = base64.b64encode(self._render_bytes(markdown_content)).decode('ascii')
             
             print(f"Enhanced DOCX generated successfully, size: {len(docx_base64)} characters")
             return docx_base64
@@ -322,8 +413,9 @@ class EnhancedDocxGenerator:
             True if successful, False otherwise
         """
         try:
-            doc = self.parse_markdown_to_docx(markdown_content)
-            doc.save(filename)
+            docx_bytes = self._render_bytes(markdown_content)
+            with open(filename, 'wb') as f:
+                f.write(docx_bytes)
             print(f"Enhanced DOCX saved successfully as {filename}")
             return True
             
@@ -6,40 +6,45 @@ Handles image and PDF processing for chat messages
 
 import base64
 import io
-import tempfile
-import os
-from typing import Optional, Tuple, List
+import importlib.util
+from typing import Optional, Tuple, List, Union
 from PIL import Image
 
-# Try to import PDF libraries (will install them later)
-try:
-    import PyPDF2
-    PYPDF2_AVAILABLE = True
-except ImportError:
-    PyPDF2 = None
-    PYPDF2_AVAILABLE = False
+# PDF libraries are only looked up here; each is imported on its first extraction, so
+# processes that never see a PDF don't pay for loading them
+PYPDF2_AVAILABLE = importlib.util.find_spec('PyPDF2') is not None
+PyPDF2 = None
 
-try:
-    import fitz  # PyMuPDF
-    PYMUPDF_AVAILABLE = True
-except ImportError:
-    fitz = None
-    PYMUPDF_AVAILABLE = False
+PYMUPDF_AVAILABLE = importlib.util.find_spec('fitz') is not None
+fitz = None
 
 from models import FileAttachment
 
+# File extension -> MIME type for uploads
+_MIME_TYPES = {
+    'pdf': 'application/pdf',
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+    'gif': 'image/gif',
+    'bmp': 'image/bmp',
+    'webp': 'image/webp',
+    'tiff': 'image/tiff',
+    'tif': 'image/tiff'
+}
+
 class FileProcessor:
     """
     Handles processing of uploaded images and PDFs for chat integration
     """
     
-    def __init__(self):
-        self.supported_image_types = {
-            'image/jpeg', 'image/jpg', 'image/png', 'image/gif', 
-            'image/bmp', 'image/webp', 'image/tiff'
-        }
-        self.supported_pdf_types = {'application/pdf'}
-        
+    # Shared, read-only MIME type sets
+    supported_image_types = frozenset({
+        'image/jpeg', 'image/jpg', 'image/png', 'image/gif', 
+        'image/bmp', 'image/webp', 'image/tiff'
+    })
+    supported_pdf_types = frozenset({'application/pdf'})
+    
     def is_supported_file(self, mime_type: str) -> bool:
         """Check if file type is supported"""
         return mime_type in self.supported_image_types or mime_type in self.supported_pdf_types
@@ -108,44 +113,37 @@ class FileProcessor:
     
     def _extract_pdf_pymupdf(self, pdf_bytes: bytes) -> str:
         """Extract text using PyMuPDF (better quality)"""
-        # Create temporary file for PyMuPDF
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_file:
-            temp_file.write(pdf_bytes)
-            temp_file_path = temp_file.name
+        global fitz
+        if fitz is None:
+            import fitz  # PyMuPDF
         
-        try:
-            # Extract text using PyMuPDF
-            doc = fitz.open(temp_file_path)
-            extracted_text = ""
-            
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                page_text = page.get_text()
-                extracted_text += f"\n--- Page {page_num + 1} ---\n"
-                extracted_text += page_text
+        # Open the PDF straight from memory, no temporary file round-trip
+        with fitz.open(stream=pdf_bytes, filetype='pdf') as doc:
+            # Collect page texts and join once; += would recopy the text so far on every page
+            parts = []
             
-            doc.close()
-            return extracted_text.strip()
+            for page_num, page in enumerate(doc, 1):
+                parts.append(f"\n--- Page {page_num} ---\n")
+                parts.append(page.get_text("text"))
             
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+            return ''.join(parts).strip()
     
     def _extract_pdf_pypdf2(self, pdf_bytes: bytes) -> str:
         """Fallback PDF text extraction using PyPDF2"""
+        global PyPDF2
         try:
+            if PyPDF2 is None:
+                import PyPDF2
+            
             pdf_file = io.BytesIO(pdf_bytes)
             pdf_reader = PyPDF2.PdfReader(pdf_file)
             
-            extracted_text = ""
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                page_text = page.extract_text()
-                extracted_text += f"\n--- Page {page_num + 1} ---\n"
-                extracted_text += page_text
+            parts = []
+            for page_num, page in enumerate(pdf_reader.pages, 1):
+                parts.append(f"\n--- Page {page_num} ---\n")
+                parts.append(page.extract_text())
             
-            return extracted_text.strip()
+            return ''.join(parts).strip()
             
         except Exception as e:
             print(f"❌ PyPDF2 extraction failed: {e}")
@@ -176,12 +174,20 @@ class FileProcessor:
             
             # Optimize image if too large (optional)
             if width > 2048 or height > 2048:
+                if format_type == 'JPEG':
+                    # Let libjpeg scale down while decoding (1/2, 1/4, 1/8), never below the
+                    # final size; thumbnail's own draft only kicks in past twice that size
+                    scale = 2048 / max(width, height)
+                    image.draft(None, (round(width * scale), round(height * scale)))
+                
                 # Resize while maintaining aspect ratio
                 image.thumbnail((2048, 2048), Image.Resampling.LANCZOS)
                 
-                # Re-encode to base64
+                # Re-encode to base64; PNGs use fast zlib level 1 (roughly twice as quick as
+                # the default 6 on photos, for a slightly larger file)
                 output_buffer = io.BytesIO()
-                image.save(output_buffer, format=format_type or 'JPEG')
+                save_options = {'compress_level': 1} if format_type == 'PNG' else {}
+                image.save(output_buffer, format=format_type or 'JPEG', **save_options)
                 attachment.content = base64.b64encode(output_buffer.getvalue()).decode('utf-8')
                 
                 print(f"🔧 Image resized to: {image.size}")
@@ -192,31 +198,44 @@ class FileProcessor:
             print(f"❌ Image processing failed: {e}")
             raise ValueError(f"Invalid image file: {e}")
     
-    def prepare_for_ai(self, attachments: List[FileAttachment]) -> Tuple[List[str], List[str]]:
+    def prepare_for_ai(self, attachments: List[FileAttachment],
+                       join: bool = False) -> Tuple[Union[List[str], str], List[str]]:
         """
         Prepare attachments for AI processing
         
         Args:
             attachments: List of processed FileAttachment objects
+            join: Return the text content as one string, entries separated by blank lines
             
         Returns:
-            Tuple of (text_content_list, image_base64_list) for AI
+            Tuple of (text_content_list, image_base64_list) for AI; text content is a
+            single string when join is True
         """
-        text_content = []
+        # Each entry is kept as its pieces, so extracted PDF text is copied only by the
+        # final join rather than first into a per-attachment string
+        text_pieces = []
         image_content = []
         
         for attachment in attachments:
             if attachment.file_type == 'pdf' and attachment.extracted_text:
-                text_content.append(
-                    f"📄 Content from '{attachment.filename}':\n{attachment.extracted_text}"
+                text_pieces.append(
+                    (f"📄 Content from '{attachment.filename}':\n", attachment.extracted_text)
                 )
             elif attachment.file_type == 'image':
                 image_content.append(attachment.content)
-                text_content.append(
-                    f"🖼️ Image uploaded: '{attachment.filename}' ({attachment.mime_type})"
+                text_pieces.append(
+                    (f"🖼️ Image uploaded: '{attachment.filename}' ({attachment.mime_type})",)
                 )
         
-        return text_content, image_content
+        if join:
+            parts = []
+            for pieces in text_pieces:
+                if parts:
+                    parts.append("\n\n")
+                parts.extend(pieces)
+            return ''.join(parts), image_content
+        
+        return [''.join(pieces) for pieces in text_pieces], image_content
     
     def get_mime_type_from_extension(self, filename: str) -> Optional[str]:
         """
@@ -228,21 +247,10 @@ class FileProcessor:
         Returns:
             MIME type string or None
         """
-        extension = filename.lower().split('.')[-1]
-        
-        mime_types = {
-            'pdf': 'application/pdf',
-            'jpg': 'image/jpeg',
-            'jpeg': 'image/jpeg',
-            'png': 'image/png',
-            'gif': 'image/gif',
-            'bmp': 'image/bmp',
-            'webp': 'image/webp',
-            'tiff': 'image/tiff',
-            'tif': 'image/tiff'
-        }
+        # Only the text after the last dot is lowercased (the whole name if there is no dot)
+        extension = filename.rpartition('.')[2].lower()
         
-        return mime_types.get(extension)
+        return _MIME_TYPES.get(extension)
 
 # Global instance
 file_processor = FileProcessor()
@@ -256,6 +264,7 @@ def extract_text_from_pdf(base64_content: str) -> str:
     """Extract text from PDF base64 content"""
     return file_processor.extract_pdf_text(base64_content)
 
-def prepare_attachments_for_ai(attachments: List[FileAttachment]) -> Tuple[List[str], List[str]]:
+def prepare_attachments_for_ai(attachments: List[FileAttachment],
+                               join: bool = False) -> Tuple[Union[List[str], str], List[str]]:
     """Prepare attachments for AI processing"""
-    return file_processor.prepare_for_ai(attachments)
\ No newline at end of file
+    return file_processor.prepare_for_ai(attachments, join)
\ No newline at end of file
@@ -112,6 +112,9 @@ docx_generator = create_configurable_generators(
     }
 )
 
+# Cached DOCX renders are only reused while the generator config is unchanged
+docx_config_fingerprint = repr(docx_generator._sens)
+
 # For PDF generation, we'll use the auto-fit PDF generator
 pdf_only_generator = AutoFitPdfGenerator()  # Keep the PDF generator separate for now
 
@@ -975,8 +978,7 @@ async def chat_endpoint(request: ChatRequest):
             
             # Prepare attachments for AI processing
             if processed_attachments:
-                text_content, image_content = prepare_attachments_for_ai(processed_attachments)
-                attachment_context = "\n\n".join(text_content)
+                attachment_context, image_content = prepare_attachments_for_ai(processed_attachments, join=True)
                 
                 # Send notification about processed files
                 await manager.send_personal_message({
@@ -1165,9 +1167,14 @@ async def generate_and_notify_resume(session_id: str, resume_data: ResumeData, u
         
         # Also generate DOCX format using configurable auto-fit generator
         print(f"Converting resume to DOCX for session {session_id}")
-        docx_base64 = docx_generator.generate_configurable_docx_base64(markdown)
+        docx_base64 = session_manager.get_cached_docx(session_id, markdown, docx_config_fingerprint)
         if docx_base64:
-            print(f"Auto-fit DOCX generated successfully, size: {len(docx_base64)} characters")
+            print(f"Reusing cached DOCX, size: {len(docx_base64)} characters")
+        else:
+            docx_base64 = docx_generator.generate_configurable_docx_base64(markdown)
+            if docx_base64:
+                print(f"Auto-fit DOCX generated successfully, size: {len(docx_base64)} characters")
+                session_manager.cache_docx(session_id, markdown, docx_base64, docx_config_fingerprint)
         
         # Update session with both markdown and PDF
         session_manager.update_resume_markdown(session_id, markdown)
@@ -1263,12 +1270,21 @@ async def generate_docx_endpoint(request: DocxGenerationRequest):
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
         
-        # Generate DOCX using configurable auto-fit generator
-        print(f"Generating configurable auto-fit DOCX for session {request.session_id}")
-        docx_base64 = docx_generator.generate_configurable_docx_base64(request.markdown)
+        # Reuse an earlier render of the same markdown before generating again
+        docx_base64 = session_manager.get_cached_docx(
+            request.session_id, request.markdown, docx_config_fingerprint)
+        if docx_base64:
+            print(f"Reusing cached DOCX for session {request.session_id}")
+        else:
+            # Generate DOCX using configurable auto-fit generator
+            print(f"Generating configurable auto-fit DOCX for session {request.session_id}")
+            docx_base64 = docx_generator.generate_configurable_docx_base64(request.markdown)
+            if docx_base64:
+                session_manager.cache_docx(
+                    request.session_id, request.markdown, docx_base64, docx_config_fingerprint)
         
         if docx_base64:
-            print(f"Auto-fit DOCX generated successfully, size: {len(docx_base64)} characters")
+            print(f"Auto-fit DOCX ready, size: {len(docx_base64)} characters")
             
             # Send update via WebSocket
             await manager.send_personal_message({
@@ -13,7 +13,7 @@ class SensitivityControlPanel:
     """
     
     def __init__(self):
-        self.current_config = SENSITIVITY_PROFILES['balanced'].copy()
+        self.current_config = SENSITIVITY_PROFILES['balanced']()
         print("🎛️ Sensitivity Control Panel Initialized")
         print("📊 Current settings: BALANCED profile")
     
@@ -24,7 +24,7 @@ class SensitivityControlPanel:
             print(f"Available profiles: {list(SENSITIVITY_PROFILES.keys())}")
             return
         
-        self.current_config = SENSITIVITY_PROFILES[profile_name].copy()
+        self.current_config = SENSITIVITY_PROFILES[profile_name]()
         print(f"✅ Loaded {profile_name.upper()} sensitivity profile")
         self.show_current_settings()
     
@@ -1,6 +1,7 @@
 import json
+import hashlib
 import redis
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, List, Tuple, Union
 from datetime import datetime, timedelta
 import uuid
 from models import SessionData, ResumeData, ChatMessage
@@ -14,6 +15,8 @@ class SessionManager:
         redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
         self.redis_client: Optional[redis.Redis] = None
         self._memory_store: Dict[str, SessionData] = {}
+        # Latest rendered DOCX per session: (digest, base64)
+        self._docx_store: Dict[str, Tuple[str, str]] = {}
         
         try:
             # Test Redis connection
@@ -77,6 +80,15 @@ class SessionManager:
         session.chat_history.append(message)
         return self.update_session(session_id, session)
     
+    def add_chat_messages(self, session_id: str, messages: List[ChatMessage]) -> bool:
+        """Add several chat messages to session with a single read and write"""
+        session = self.get_session(session_id)
+        if not session:
+            return False
+        
+        session.chat_history.extend(messages)
+        return self.update_session(session_id, session)
+    
     def update_resume_data(self, session_id: str, resume_data: ResumeData) -> bool:
         """Update resume data in session"""
         session = self.get_session(session_id)
@@ -95,11 +107,48 @@ class SessionManager:
         session.resume_markdown = markdown
         return self.update_session(session_id, session)
     
+    @staticmethod
+    def _docx_digest(markdown: str, config_fingerprint: str) -> str:
+        """Identify a render by its markdown and the generator config that produced it"""
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(config_fingerprint.encode('utf-8'))
+        hasher.update(b'\0')
+        hasher.update(markdown.encode('utf-8'))
+        return hasher.hexdigest()
+    
+    def get_cached_docx(self, session_id: str, markdown: str, config_fingerprint: str = "") -> Optional[str]:
+        """Get the session's last rendered base64 DOCX if it was made from this markdown and config"""
+        digest = self._docx_digest(markdown, config_fingerprint)
+        if self.redis_client:
+            data = self.redis_client.get(f"docx:{session_id}")
+            if not isinstance(data, str):
+                return None
+            entry = json.loads(data)
+            return entry["docx"] if entry.get("digest") == digest else None
+        entry = self._docx_store.get(session_id)
+        return entry[1] if entry and entry[0] == digest else None
+    
+    def cache_docx(self, session_id: str, markdown: str, docx_base64: str, config_fingerprint: str = "") -> bool:
+        """Store a rendered base64 DOCX, replacing the session's previous one"""
+        digest = self._docx_digest(markdown, config_fingerprint)
+        if self.redis_client:
+            result = self.redis_client.setex(
+                f"docx:{session_id}",
+                int(self.session_timeout.total_seconds()),
+                json.dumps({"digest": digest, "docx": docx_base64})
+            )
+            return bool(result)
+        else:
+            self._docx_store[session_id] = (digest, docx_base64)
+            return True
+    
     def delete_session(self, session_id: str) -> bool:
         """Delete a session"""
         if self.redis_client:
+            self.redis_client.delete(f"docx:{session_id}")
             return bool(self.redis_client.delete(f"session:{session_id}"))
         else:
+            self._docx_store.pop(session_id, None)
             return self._memory_store.pop(session_id, None) is not None
     
     def extend_session(self, session_id: str) -> bool:
@@ -121,4 +170,5 @@ class SessionManager:
                     expired_sessions.append(session_id)
             
             for session_id in expired_sessions:
-                del self._memory_store[session_id]
\ No newline at end of file
+                del self._memory_store[session_id]
+                self._docx_store.pop(session_id, None)
\ No newline at end of file
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test compact markdown spacing normalization
+Checks that fix_compact_markdown collapses blank lines and normalizes bullets
+"""
+
+import sys
+import os
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from compact_parser import CompactMarkdownParser
+
+def test_fix_compact_markdown_spacing():
+    """Blank lines, trailing whitespace and bullets are normalized; inline markup is untouched"""
+
+    spacing_heavy_markdown = """# John Smith
+john.smith@email.com | (555) 123-4567
+
+
+## Experience
+
+
+**Lead Engineer**
+*TechCorp | 2020 - Present*
+
+
+• Built **services** with `Python`
+* Reduced latency by *45%*\t
+
+
+
+## Skills
+**Languages:** `Python`, *Go*"""
+
+    expected = """# John Smith
+john.smith@email.com | (555) 123-4567
+
+## Experience
+**Lead Engineer**
+*TechCorp | 2020 - Present*
+- Built **services** with `Python`
+- Reduced latency by *45%*
+
+## Skills
+**Languages:** `Python`, *Go*"""
+
+    print("🧪 Testing compact markdown spacing")
+    print("=" * 40)
+
+    parser = CompactMarkdownParser()
+    result = parser.fix_compact_markdown(spacing_heavy_markdown)
+
+    assert result == expected, f"Unexpected compact markdown:\n{result!r}"
+    assert '\n\n\n' not in result
+    print("✅ Blank lines collapsed, bullets normalized, formatting preserved")
+
+def test_bare_star_line_before_unicode_bullet():
+    """A bare '*' line does not swallow the following lines and leave their bullet marker raw"""
+
+    parser = CompactMarkdownParser()
+
+    assert parser.fix_compact_markdown('* \n\n\n\t▪ Led team') == '- - Led team'
+    assert parser.fix_compact_markdown('- Skills\n\n▪ \n*\n\nSummary text') == '- Skills\n- *\n\nSummary text'
+    print("✅ Unicode bullets after a bare '*' line are normalized")
+
+def test_contact_line_with_url_keeps_contact_class():
+    """A contact line containing a bare URL is still tagged compact-contact"""
+
+    contact_markdown = """# Jane Doe
+jane@x.com | (555) 123-4567 | https://github.com/jane
+
+## Experience"""
+
+    print("🧪 Testing compact contact line class")
+    print("=" * 40)
+
+    parser = CompactMarkdownParser()
+    html = parser.create_compact_html(contact_markdown)
+
+    assert '<p class="compact-contact">jane@x.com | (555) 123-4567 | https://github.com/jane</p>' in html, html
+    print("✅ Contact line keeps its compact-contact class")
+
+if __name__ == "__main__":
+    test_fix_compact_markdown_spacing()
+    test_bare_star_line_before_unicode_bullet()
+    test_contact_line_with_url_keeps_contact_class()
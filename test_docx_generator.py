@@ -147,7 +147,31 @@ Results-driven software engineer with 6+ years of experience in full-stack devel
         print(f"❌ Error during DOCX generation test: {e}")
         return False
 
+def test_batch_uses_generator_colors():
+    """Batch renders keep the calling generator's colors, matching a single render"""
+    
+    import base64
+    import io
+    from docx import Document
+    from docx.shared import RGBColor
+    
+    generator = ProfessionalDocxGenerator()
+    generator.primary_color = RGBColor(200, 30, 30)
+    markdown = "# Batch Color Check\nbatch@example.com\n\n## Experience\n- Led team"
+    
+    def header_color(docx_base64):
+        document = Document(io.BytesIO(base64.b64decode(docx_base64)))
+        return str(document.styles['ResumeHeader'].font.color.rgb)
+    
+    batch_base64 = generator.generate_docx_base64_batch([markdown])[0]
+    assert header_color(batch_base64) == 'C81E1E'
+    assert header_color(generator.generate_docx_base64(markdown)) == 'C81E1E'
+    
+    # The shared render cache must not hand the recolored output to a default generator
+    assert header_color(ProfessionalDocxGenerator().generate_docx_base64(markdown)) == '2C5AA0'
+
 if __name__ == "__main__":
+    test_batch_uses_generator_colors()
     success = test_docx_generation()
     if success:
         print("\n✅ Ready to integrate DOCX functionality into the main application!")